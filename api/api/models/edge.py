@@ -1,11 +1,12 @@
 """
     Edge model - representation of an edge between nodes.
 """
+from copy import deepcopy
 from typing import Dict, Any, Optional, Tuple
 from enum import Enum
 from datetime import date, datetime
 from ..types import ValueType, TypeValidator
-from .node import Node
+from .node import Node, _copy_attribute_values
 
 
 class EdgeDirection(Enum):
@@ -20,6 +21,9 @@ class Edge:
         An edge can be directed or undirected.
     """
 
+    __slots__ = ('edge_id', 'source_node', 'target_node', 'direction',
+                 'attributes', 'attribute_types')
+
     def __init__(
             self,
             edge_id: Any,
@@ -50,6 +54,46 @@ class Edge:
         for key, value in attributes.items():
             self.set_attribute(key, value)
 
+    @classmethod
+    def from_attributes(
+            cls,
+            edge_id: Any,
+            source_node: Node,
+            target_node: Node,
+            direction: EdgeDirection,
+            attributes: Dict[str, Any]
+    ) -> "Edge":
+        """
+        Create an edge from an existing attribute dict.
+
+        Same result as ``Edge(edge_id, source, target, direction, **attributes)``
+        without packing the attributes into a second kwargs dict.
+        """
+        edge = cls(edge_id, source_node, target_node, direction)
+        for key, value in attributes.items():
+            edge.set_attribute(key, value)
+        return edge
+
+    def __deepcopy__(self, memo: dict) -> "Edge":
+        """
+        Copy the edge with new attribute dicts.
+
+        Endpoints go through ``memo``, so copying a whole graph links the
+        edge to the already-copied nodes.
+        """
+        cls = type(self)
+        edge = cls.__new__(cls)
+        memo[id(self)] = edge
+        edge.edge_id = self.edge_id
+        edge.source_node = deepcopy(self.source_node, memo)
+        edge.target_node = deepcopy(self.target_node, memo)
+        edge.direction = self.direction
+        edge.attributes = _copy_attribute_values(self.attributes, memo)
+        edge.attribute_types = dict(self.attribute_types)
+        if hasattr(self, '__dict__'):
+            edge.__dict__.update(deepcopy(self.__dict__, memo))
+        return edge
+
     def set_attribute(self, key: str, value: Any) -> None:
         """
         Set edge attribute with type detection.
@@ -2,11 +2,15 @@
     Graph model - complete graph model.
     Support for directed/undirected, cyclic/acyclic graphs.
 """
-from typing import Dict, List, Set, Optional
+from typing import Dict, Iterable, List, Set, Optional
 from copy import deepcopy
 from .node import Node
 from .edge import Edge, EdgeDirection
 
+# DFS node states used by Graph.has_cycle
+_ON_PATH = 1
+_DONE = 2
+
 
 class Graph:
     """
@@ -50,12 +54,104 @@ class Graph:
         if edge.source_node.node_id != edge.target_node.node_id:
             self._adjacency_list[edge.target_node.node_id].append(edge)
 
+    def add_nodes_bulk(self, nodes: Iterable[Node]) -> None:
+        """
+        Add many nodes in one step (for data source plugins).
+
+        Performs the same duplicate check as ``add_node``; if any node is
+        rejected, none of the batch is added.
+        """
+        new_nodes: Dict[str, Node] = {}
+        for node in nodes:
+            node_id = node.node_id
+            if node_id in self.nodes or node_id in new_nodes:
+                raise ValueError(f"Node with id {node_id} already exists")
+            new_nodes[node_id] = node
+
+        self.nodes.update(new_nodes)
+        self._adjacency_list.update((node_id, []) for node_id in new_nodes)
+
+    def add_edges_bulk(self, edges: Iterable[Edge]) -> None:
+        """
+        Add many edges in one step (for data source plugins).
+
+        Performs the same checks as ``add_edge``; if any edge is rejected,
+        none of the batch is added.
+        """
+        new_edges: Dict[str, Edge] = {}
+        nodes = self.nodes
+        for edge in edges:
+            if edge.source_node.node_id not in nodes:
+                raise ValueError(f"Source node {edge.source_node.node_id} not in graph")
+            if edge.target_node.node_id not in nodes:
+                raise ValueError(f"Target node {edge.target_node.node_id} not in graph")
+            if edge.edge_id in self.edges or edge.edge_id in new_edges:
+                raise ValueError(f"Edge with id {edge.edge_id} already exists")
+            new_edges[edge.edge_id] = edge
+
+        self.edges.update(new_edges)
+
+        adjacency = self._adjacency_list
+        for edge in new_edges.values():
+            source_id = edge.source_node.node_id
+            target_id = edge.target_node.node_id
+            adjacency[source_id].append(edge)
+            if source_id != target_id:
+                adjacency[target_id].append(edge)
+
+    def bulk_load(self, nodes: Iterable[Node], edges: Iterable[Edge]) -> None:
+        """
+        Add a batch of nodes and the edges between them in one step.
+
+        Edges may reference nodes from the same batch. If any node or edge
+        is rejected, the graph is left unchanged.
+        """
+        nodes = list(nodes)
+        self.add_nodes_bulk(nodes)
+        try:
+            self.add_edges_bulk(edges)
+        except ValueError:
+            for node in nodes:
+                del self.nodes[node.node_id]
+                del self._adjacency_list[node.node_id]
+            raise
+
+    def __deepcopy__(self, memo: dict) -> 'Graph':
+        """
+        Copy the graph container by container.
+
+        Nodes are copied once and edges/adjacency lists are rebuilt around
+        those copies, instead of letting ``deepcopy`` walk every reference
+        through the memo.
+        """
+        cls = type(self)
+        graph = cls.__new__(cls)
+        memo[id(self)] = graph
+        for key, value in self.__dict__.items():
+            if key not in ('nodes', 'edges', '_adjacency_list'):
+                graph.__dict__[key] = deepcopy(value, memo)
+
+        graph.nodes = {node_id: deepcopy(node, memo) for node_id, node in self.nodes.items()}
+        graph.edges = {edge_id: deepcopy(edge, memo) for edge_id, edge in self.edges.items()}
+        new_edges = graph.edges
+        graph._adjacency_list = {
+            node_id: [new_edges[edge.edge_id] for edge in edges]
+            for node_id, edges in self._adjacency_list.items()
+        }
+        return graph
+
     def get_node(self, node_id: str) -> Optional[Node]:
         return self.nodes.get(node_id)
 
     def get_edge(self, edge_id: str) -> Optional[Edge]:
         return self.edges.get(edge_id)
 
+    def contains_node(self, node_id: str) -> bool:
+        return node_id in self.nodes
+
+    def contains_edge(self, edge_id: str) -> bool:
+        return edge_id in self.edges
+
     def get_all_nodes(self) -> List[Node]:
         return list(self.nodes.values())
 
@@ -142,45 +238,87 @@ class Graph:
         """
         Check if the graph has a cycle.
         Supports mixed (directed/undirected) graphs.
-        """
-        visited = set()
-        rec_stack = set()
-        parent_map = {}  # Needed for undirected cycle detection
-
-        def dfs(node_id: str, parent_id: Optional[str]) -> bool:
-            visited.add(node_id)
-            rec_stack.add(node_id)
-            parent_map[node_id] = parent_id
-
-            node = self.nodes[node_id]
 
-            # Use get_outgoing_edges which now supports undirected edges
-            for edge in self.get_outgoing_edges(node):
-                neighbor = edge.get_other_node(node)
-                if not neighbor and edge.source_node == edge.target_node:
-                    neighbor = node  # Self loop
+        Iterative DFS with an explicit stack of edge iterators, so large
+        graphs do not hit the recursion limit.  Graphs with only undirected
+        edges take a union-find pass over the edges instead.
+        """
+        undirected = EdgeDirection.UNDIRECTED
+        if all(edge.direction is undirected for edge in self.edges.values()):
+            return self._has_undirected_cycle()
+
+        adjacency = self._adjacency_list
+        # node_id -> _ON_PATH while on the DFS path, _DONE once finished
+        state: Dict[str, int] = {}
+
+        for root_id in self.nodes:
+            if root_id in state:
+                continue
+            state[root_id] = _ON_PATH
+            # (node_id, parent_id, iterator over the node's edges)
+            stack = [(root_id, None, iter(adjacency.get(root_id, ())))]
+            while stack:
+                node_id, parent_id, edges = stack[-1]
+                for edge in edges:
+                    # Outgoing edges only; undirected edges count both ways
+                    if edge.source_node.node_id == node_id:
+                        neighbor_id = edge.target_node.node_id
+                    elif edge.direction is undirected:
+                        neighbor_id = edge.source_node.node_id
+                    else:
+                        continue
+
+                    seen = state.get(neighbor_id)
+                    if seen is None:
+                        state[neighbor_id] = _ON_PATH
+                        stack.append(
+                            (neighbor_id, node_id, iter(adjacency.get(neighbor_id, ())))
+                        )
+                        break
+                    if seen == _ON_PATH:
+                        # For undirected, we must not go directly back to parent
+                        if edge.direction is not undirected or neighbor_id != parent_id:
+                            return True
+                else:
+                    state[node_id] = _DONE
+                    stack.pop()
 
-                neighbor_id = neighbor.node_id
+        return False
 
-                if neighbor_id not in visited:
-                    if dfs(neighbor_id, node_id):
-                        return True
-                elif neighbor_id in rec_stack:
-                    # For undirected, we must not go directly back to parent
-                    if edge.direction == EdgeDirection.UNDIRECTED:
-                        if neighbor_id != parent_id:
-                            return True
-                    else:
-                        # Directed back-edge always means cycle
-                        return True
+    def _has_undirected_cycle(self) -> bool:
+        """
+        Union-find cycle check for graphs whose edges are all undirected.
 
-            rec_stack.remove(node_id)
-            return False
+        An edge closes a cycle when its endpoints are already connected.
+        Parallel edges between the same pair are not a cycle, matching the
+        DFS (which never walks straight back to its parent); self loops are.
+        """
+        parent: Dict[str, str] = {}
+        # Endpoint pairs of the edges that merged two components; a later
+        # edge between an already-connected pair can only be a parallel
+        # duplicate if its pair is one of these
+        tree_pairs: Set[tuple] = set()
+
+        def find(node_id: str) -> str:
+            root = node_id
+            while root in parent:
+                root = parent[root]
+            # Path compression
+            while node_id != root:
+                parent[node_id], node_id = root, parent[node_id]
+            return root
 
-        for node_id in self.nodes:
-            if node_id not in visited:
-                if dfs(node_id, None):
-                    return True
+        for edge in self.edges.values():
+            source_id = edge.source_node.node_id
+            target_id = edge.target_node.node_id
+            source_root, target_root = find(source_id), find(target_id)
+            if source_root != target_root:
+                parent[source_root] = target_root
+                tree_pairs.add((source_id, target_id))
+            elif ((source_id, target_id) not in tree_pairs
+                    and (target_id, source_id) not in tree_pairs):
+                # Also covers self loops, which never merge components
+                return True
 
         return False
 
@@ -188,29 +326,48 @@ class Graph:
         """
         Create a subgraph (deep copy) with specified nodes.
         """
-        subgraph = Graph(f"{self.graph_id}_sub")
+        return self.get_subgraph_by_node_refs(
+            self.nodes[node_id] for node_id in node_ids if node_id in self.nodes
+        )
 
-        # Use deepcopy so changes to the subgraph don't affect the main graph
-        for node_id in node_ids:
-            if node_id in self.nodes:
-                subgraph.add_node(deepcopy(self.nodes[node_id]))
+    def get_subgraph_by_node_refs(self, nodes: Iterable[Node]) -> 'Graph':
+        """
+        Create a subgraph (deep copy) from node instances of this graph.
 
-        # Add edges only if both nodes exist in the subgraph
-        for edge in self.edges.values():
-            if edge.source_node.node_id in node_ids and \
-                    edge.target_node.node_id in node_ids:
+        Same result as ``get_subgraph_by_nodes`` but skips the
+        id → node lookups when the caller already holds the nodes.
+        """
+        subgraph = Graph(f"{self.graph_id}_sub")
+
+        # Use deepcopy so changes to the subgraph don't affect the main graph.
+        # Node/Edge.__deepcopy__ share immutable attribute values, so this is
+        # a copy of the attribute dicts rather than a recursive walk.
+        memo: dict = {}
+        for node in nodes:
+            if node.node_id not in subgraph.nodes:
+                subgraph.add_node(deepcopy(node, memo))
+
+        node_ids = subgraph.nodes
+        adjacency = self._adjacency_list
+
+        # Add edges only if both nodes exist in the subgraph.  Only edges
+        # incident to the selected nodes are visited; each edge is taken
+        # from its source node's list so it is added once.
+        new_edges = []
+        for node_id, new_source in node_ids.items():
+            for edge in adjacency.get(node_id, ()):
+                if edge.source_node.node_id != node_id:
+                    continue
                 # Must find new instances of nodes in the subgraph
-                new_source = subgraph.get_node(edge.source_node.node_id)
-                new_target = subgraph.get_node(edge.target_node.node_id)
-
-                new_edge = Edge(
-                    edge.edge_id,
-                    new_source,
-                    new_target,
-                    edge.direction,
-                    **edge.attributes
-                )
-                subgraph.add_edge(new_edge)
+                new_target = node_ids.get(edge.target_node.node_id)
+                if new_target is None:
+                    continue
+                # Copying keeps the stored values and types as they are,
+                # instead of re-running type detection on every attribute
+                memo[id(edge.source_node)] = new_source
+                memo[id(edge.target_node)] = new_target
+                new_edges.append(deepcopy(edge, memo))
+        subgraph.add_edges_bulk(new_edges)
 
         return subgraph
 
@@ -1,10 +1,23 @@
 """
     Node model - representation of a node in the graph
 """
+from copy import deepcopy
 from typing import Dict, Any, Optional
 from datetime import date, datetime
 from ..types import ValueType, TypeValidator
 
+# Attribute value types that copies can share instead of duplicating
+_IMMUTABLE_VALUE_TYPES = frozenset({str, int, float, bool, date, datetime, type(None)})
+
+
+def _copy_attribute_values(attributes: Dict[str, Any], memo: dict) -> Dict[str, Any]:
+    """Copy an attribute dict, sharing immutable values and deep-copying the rest."""
+    immutable = _IMMUTABLE_VALUE_TYPES
+    return {
+        key: value if type(value) in immutable else deepcopy(value, memo)
+        for key, value in attributes.items()
+    }
+
 
 class Node:
     """
@@ -14,6 +27,8 @@ class Node:
     Supports multiple value types: int, str, float, date (per spec §2.1).
     """
 
+    __slots__ = ('node_id', 'attributes', 'attribute_types')
+
     def __init__(self, node_id: Any, **attributes):
         """
         Initialize a node.
@@ -31,6 +46,37 @@ class Node:
         for key, value in attributes.items():
             self.set_attribute(key, value)
 
+    @classmethod
+    def from_attributes(cls, node_id: Any, attributes: Dict[str, Any]) -> "Node":
+        """
+        Create a node from an existing attribute dict.
+
+        Same result as ``cls(node_id, **attributes)`` without packing the
+        attributes into a second kwargs dict.
+        """
+        node = cls(node_id)
+        for key, value in attributes.items():
+            node.set_attribute(key, value)
+        return node
+
+    def __deepcopy__(self, memo: dict) -> "Node":
+        """
+        Copy the node with new attribute dicts.
+
+        Values set through ``set_attribute`` are immutable scalars and are
+        shared with the copy, so no per-value deepcopy dispatch is needed.
+        """
+        cls = type(self)
+        node = cls.__new__(cls)
+        memo[id(self)] = node
+        node.node_id = self.node_id
+        node.attributes = _copy_attribute_values(self.attributes, memo)
+        node.attribute_types = dict(self.attribute_types)
+        if hasattr(self, '__dict__'):
+            # Subclass without __slots__
+            node.__dict__.update(deepcopy(self.__dict__, memo))
+        return node
+
     def set_attribute(self, key: str, value: Any) -> None:
         """
         Set node attribute with type detection.
@@ -1,8 +1,9 @@
 """
     Type support for int, str, float, date with validation.
 """
+import operator as _operator
 from enum import Enum
-from typing import Any
+from typing import Any, Callable, Dict
 from datetime import date, datetime
 
 
@@ -14,6 +15,41 @@ class ValueType(Enum):
     BOOL = "bool"
 
 
+def _to_date(value: Any) -> Any:
+    if isinstance(value, str):
+        return datetime.fromisoformat(value).date()
+    elif isinstance(value, datetime):
+        return value.date()
+    return value
+
+
+def _to_bool(value: Any) -> bool:
+    if isinstance(value, str):
+        return value.lower() in ('true', '1', 'yes')
+    return bool(value)
+
+
+# Conversion function per target type
+_CONVERTERS: Dict[ValueType, Callable[[Any], Any]] = {
+    ValueType.INT: int,
+    ValueType.FLOAT: float,
+    ValueType.DATE: _to_date,
+    ValueType.BOOL: _to_bool,
+    ValueType.STR: str,
+}
+
+
+# Comparison function per filter operator
+_COMPARATORS: Dict[str, Callable[[Any, Any], bool]] = {
+    '==': _operator.eq,
+    '!=': _operator.ne,
+    '<': _operator.lt,
+    '<=': _operator.le,
+    '>': _operator.gt,
+    '>=': _operator.ge,
+}
+
+
 class TypeValidator:
     """Validation and conversion of value types"""
 
@@ -52,22 +88,17 @@ class TypeValidator:
     @staticmethod
     def convert_to_type(value: Any, target_type: ValueType) -> Any:
         """Convert value to target type"""
-        if target_type == ValueType.INT:
-            return int(value)
-        elif target_type == ValueType.FLOAT:
-            return float(value)
-        elif target_type == ValueType.DATE:
-            if isinstance(value, str):
-                return datetime.fromisoformat(value).date()
-            elif isinstance(value, datetime):
-                return value.date()
-            return value
-        elif target_type == ValueType.BOOL:
-            if isinstance(value, str):
-                return value.lower() in ('true', '1', 'yes')
-            return bool(value)
-        else:  # STR
-            return str(value)
+        return _CONVERTERS.get(target_type, str)(value)
+
+    @staticmethod
+    def get_converter(target_type: ValueType) -> Callable[[Any], Any]:
+        """
+        Return the conversion function for target type.
+
+        Lets callers that convert many values to the same type resolve
+        the conversion once instead of dispatching on every call.
+        """
+        return _CONVERTERS.get(target_type, str)
 
     @staticmethod
     def validate_and_convert(value: Any, target_type: ValueType) -> Any:
@@ -80,16 +111,8 @@ class TypeValidator:
     @staticmethod
     def compare(value1: Any, value2: Any, operator: str) -> bool:
         """Compare values according to operator"""
-        operators = {
-            '==': lambda a, b: a == b,
-            '!=': lambda a, b: a != b,
-            '<': lambda a, b: a < b,
-            '<=': lambda a, b: a <= b,
-            '>': lambda a, b: a > b,
-            '>=': lambda a, b: a >= b,
-        }
-
-        if operator not in operators:
+        compare_fn = _COMPARATORS.get(operator)
+        if compare_fn is None:
             raise ValueError(f"Unknown operator: {operator}")
 
         # BOOL only supports equality checks; ordering is undefined
@@ -101,6 +124,6 @@ class TypeValidator:
                 )
 
         try:
-            return operators[operator](value1, value2)
+            return compare_fn(value1, value2)
         except TypeError as e:
             raise TypeError(f"Cannot compare {type(value1).__name__} and {type(value2).__name__}: {str(e)}")
\ No newline at end of file
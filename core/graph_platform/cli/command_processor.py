@@ -9,14 +9,18 @@
 
     The processor is aware of the current graph on the Main View
     (accessed through the Workspace).  Every mutating command is
-    recorded in an undo stack so the user can step back.
+    recorded in an undo stack so the user can step back; without a
+    Workspace the stack holds the executed commands themselves and
+    undo calls ``command.undo(graph)``.
 """
 from __future__ import annotations
 
 import logging
 import re
 import shlex
-from typing import List, Optional, Dict, Any, Tuple
+from collections import deque
+from functools import lru_cache
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 
 from api.models.graph import Graph
 
@@ -41,6 +45,47 @@ from .commands import (
 
 logger = logging.getLogger(__name__)
 
+# A token is a run of plain characters and complete quoted sections
+# (same splitting as shlex.split without escapes).  Anything else —
+# a stray quote or a backslash — is matched as ``bad`` and sends the
+# line through shlex instead.
+_TOKEN_RE = re.compile(r"""(?P<tok>(?:[^ \t\r\n'"\\]|'[^']*'|"[^"]*")+)|(?P<bad>[^ \t\r\n])""")
+_QUOTED_RE = re.compile(r"'([^']*)'|\"([^\"]*)\"")
+
+
+def _unquote(match: re.Match) -> str:
+    single = match.group(1)
+    return single if single is not None else match.group(2)
+
+
+@lru_cache(maxsize=256)
+def _tokenize(text: str) -> Tuple[str, ...]:
+    """
+    Split a command line into tokens with shell-style quoting.
+
+    Equivalent to ``shlex.split(text)`` for lines without backslashes or
+    unbalanced quotes, but runs on precompiled patterns instead of building
+    a lexer per call.  Other lines use ``shlex.split``; if that fails too,
+    the line is split on whitespace.
+
+    Cached per line: tokenizing is pure and interactive sessions repeat
+    the same ``help`` / ``list`` / ``info`` lines.  Only tokens are cached,
+    never command results, which depend on the graph.
+    """
+    tokens = []
+    for match in _TOKEN_RE.finditer(text):
+        token = match.group('tok')
+        if token is None:
+            try:
+                return tuple(shlex.split(text))
+            except ValueError:
+                # Fallback: simple split if quotes are malformed
+                return tuple(text.split())
+        if "'" in token or '"' in token:
+            token = _QUOTED_RE.sub(_unquote, token)
+        tokens.append(token)
+    return tuple(tokens)
+
 
 class CommandProcessor:
     """
@@ -52,12 +97,41 @@ class CommandProcessor:
         result = processor.process("create node --id=1 --property Name=Alice")
     """
 
-    def __init__(self):
+    def __init__(self, max_undo: int = 50):
         """
         Initialize the processor.
+
+        :param max_undo: Number of commands kept for undo; the oldest entry
+            is dropped once the limit is reached. ``0`` disables undo.
+        :raises ValueError: If ``max_undo`` is negative
         """
-        self._undo_stack: List[Graph] = []
-        self._max_undo = 50
+        if max_undo < 0:
+            raise ValueError(f"max_undo must be >= 0, got {max_undo}")
+        self._max_undo = max_undo
+        self._undo_stack: Deque[Command] = deque(maxlen=max_undo)
+
+        # Verb → parser taking the remaining tokens
+        self._verbs: Dict[str, Callable[[List[str]], Command]] = {
+            "help": lambda args: HelpCommand(),
+            "undo": lambda args: UndoCommand(),
+            "reset": lambda args: ResetCommand(),
+            "clear": lambda args: ClearCommand(),
+            "filter": self._parse_filter,
+            "search": self._parse_search,
+            "list": self._parse_list,
+            "info": self._parse_info,
+            "create": lambda args: self._parse_entity_command("create", args),
+            "edit": lambda args: self._parse_entity_command("edit", args),
+            "delete": lambda args: self._parse_entity_command("delete", args),
+        }
+        self._entity_parsers: Dict[Tuple[str, str], Callable[[List[str]], Command]] = {
+            ("create", "node"): self._parse_create_node,
+            ("create", "edge"): self._parse_create_edge,
+            ("edit", "node"): self._parse_edit_node,
+            ("edit", "edge"): self._parse_edit_edge,
+            ("delete", "node"): lambda args: self._parse_delete(args, "node"),
+            ("delete", "edge"): lambda args: self._parse_delete(args, "edge"),
+        }
 
     # ── Public API ───────────────────────────────────────────────
 
@@ -126,53 +200,49 @@ class CommandProcessor:
                 data={"action": "reset"},
             )
 
-        # --- filter / search: execute first, push snapshot on success ---
+        # --- filter / search: execute first, record on success ---
         if isinstance(command, (FilterCommand, SearchCommand)):
             result = command.execute(graph)
             if result.success and result.graph is not None:
                 if workspace is not None:
                     workspace._push_snapshot()
                 else:
-                    self._push_undo(graph)
+                    self._undo_stack.append(command)
             return result
 
-        # --- Standard mutating commands ---
-        if command.supports_undo:
-            if workspace is not None:
-                workspace._push_snapshot()
-            else:
-                from copy import deepcopy
-                self._push_undo(deepcopy(graph))
-
-        result = command.execute(graph)
+        # --- Read-only commands (help, info, list): no undo bookkeeping ---
+        if not command.supports_undo:
+            return command.execute(graph)
 
-        # Roll back the pre-emptive snapshot if the command failed
-        if not result.success and command.supports_undo:
-            if workspace is not None:
+        # --- Standard mutating commands ---
+        if workspace is not None:
+            workspace._push_snapshot()
+            result = command.execute(graph)
+            # Roll back the pre-emptive snapshot if the command failed
+            if not result.success:
                 workspace._pop_snapshot()
-            elif self._undo_stack:
-                self._undo_stack.pop()
+            return result
 
+        result = command.execute(graph)
+        if result.success and self._max_undo:
+            # The command keeps its own inverse state; deque drops the oldest
+            self._undo_stack.append(command)
         return result
 
     def _do_undo(self, graph: Graph) -> CommandResult:
-        """Pop the last snapshot and restore it."""
+        """Pop the last command and reverse it."""
         if not self._undo_stack:
             return CommandResult(False, "Nothing to undo.", graph)
 
-        old_graph = self._undo_stack.pop()
+        result = self._undo_stack.pop().undo(graph)
+        if not result.success:
+            return result
         return CommandResult(
             True,
             f"Undo successful (stack depth: {len(self._undo_stack)}).",
-            old_graph,
+            result.graph,
         )
 
-    def _push_undo(self, graph_snapshot: Graph) -> None:
-        """Save a graph snapshot for potential undo."""
-        if len(self._undo_stack) >= self._max_undo:
-            self._undo_stack.pop(0)
-        self._undo_stack.append(graph_snapshot)
-
     # ── Comment handling ────────────────────────────────────────
 
     @staticmethod
@@ -208,140 +278,126 @@ class CommandProcessor:
         Raises:
             ValueError: If the text cannot be parsed.
         """
-        # Normalize and tokenize using shlex for proper quote handling
-        try:
-            tokens = shlex.split(text)
-        except ValueError:
-            # Fallback: simple split if quotes are malformed
-            tokens = text.split()
+        tokens = list(_tokenize(text))
 
         if not tokens:
             raise ValueError("Empty command.")
 
         verb = tokens[0].lower()
+        parser = self._verbs.get(verb)
+        if parser is None:
+            raise ValueError(f"Unknown command: '{verb}'. Type 'help' for usage.")
+        return parser(tokens[1:])
 
-        # ── Single-word commands ──
-        if verb == "help":
-            return HelpCommand()
-        if verb == "undo":
-            return UndoCommand()
-        if verb == "reset":
-            return ResetCommand()
-        if verb == "clear":
-            return ClearCommand()
-
-        # ── filter / search ──
-        if verb == "filter":
-            query = self._extract_query(tokens[1:])
-            return FilterCommand(query)
-        if verb == "search":
-            query = self._extract_query(tokens[1:])
-            return SearchCommand(query)
-
-        # ── list ──
-        if verb == "list":
-            target = tokens[1].lower() if len(tokens) > 1 else None
-            if target not in (None, "nodes", "edges"):
-                raise ValueError(f"Unknown list target: '{target}'. Use 'nodes' or 'edges'.")
-            return ListCommand(target)
-
-        # ── info ──
-        if verb == "info":
-            if len(tokens) == 1:
-                return InfoCommand()
-            target_type = tokens[1].lower() if len(tokens) > 1 else None
-            target_id = tokens[2] if len(tokens) > 2 else None
-            if target_type not in ("node", "edge"):
-                raise ValueError("Usage: info [node|edge] <id>")
-            if target_id is None:
-                raise ValueError(f"Usage: info {target_type} <id>")
-            return InfoCommand(target_type, target_id)
-
-        # ── create / edit / delete ──
-        if verb in ("create", "edit", "delete"):
-            if len(tokens) < 2:
-                raise ValueError(f"Usage: {verb} <node|edge> ...")
-            entity = tokens[1].lower()
-            remaining = tokens[2:]
-
-            if verb == "create" and entity == "node":
-                return self._parse_create_node(remaining)
-            if verb == "create" and entity == "edge":
-                return self._parse_create_edge(remaining)
-            if verb == "edit" and entity == "node":
-                return self._parse_edit_node(remaining)
-            if verb == "edit" and entity == "edge":
-                return self._parse_edit_edge(remaining)
-            if verb == "delete" and entity == "node":
-                return self._parse_delete(remaining, "node")
-            if verb == "delete" and entity == "edge":
-                return self._parse_delete(remaining, "edge")
+    # ── Verb parsers (dispatched through ``self._verbs``) ────────
 
-            raise ValueError(f"Unknown entity: '{entity}'. Use 'node' or 'edge'.")
+    @staticmethod
+    def _parse_filter(args: List[str]) -> Command:
+        return FilterCommand(CommandProcessor._extract_query(args))
 
-        raise ValueError(f"Unknown command: '{verb}'. Type 'help' for usage.")
+    @staticmethod
+    def _parse_search(args: List[str]) -> Command:
+        return SearchCommand(CommandProcessor._extract_query(args))
 
-    # ── Token parsers ────────────────────────────────────────────
+    @staticmethod
+    def _parse_list(args: List[str]) -> Command:
+        target = args[0].lower() if args else None
+        if target not in (None, "nodes", "edges"):
+            raise ValueError(f"Unknown list target: '{target}'. Use 'nodes' or 'edges'.")
+        return ListCommand(target)
 
     @staticmethod
-    def _extract_id(tokens: List[str]) -> Tuple[str, List[str]]:
-        """
-        Extract --id=<value> from token list.
-        Returns (id_value, remaining_tokens).
-        """
-        remaining = []
-        found_id = None
-        i = 0
-        while i < len(tokens):
-            token = tokens[i]
-            if token.startswith("--id="):
-                found_id = token[5:]
-            elif token == "--id" and i + 1 < len(tokens):
-                found_id = tokens[i + 1]
-                i += 1
-            else:
-                remaining.append(token)
-            i += 1
+    def _parse_info(args: List[str]) -> Command:
+        if not args:
+            return InfoCommand()
+        target_type = args[0].lower()
+        target_id = args[1] if len(args) > 1 else None
+        if target_type not in ("node", "edge"):
+            raise ValueError("Usage: info [node|edge] <id>")
+        if target_id is None:
+            raise ValueError(f"Usage: info {target_type} <id>")
+        return InfoCommand(target_type, target_id)
+
+    def _parse_entity_command(self, verb: str, args: List[str]) -> Command:
+        """Dispatch ``create|edit|delete <node|edge> ...`` on the entity."""
+        if not args:
+            raise ValueError(f"Usage: {verb} <node|edge> ...")
+        entity = args[0].lower()
+        parser = self._entity_parsers.get((verb, entity))
+        if parser is None:
+            raise ValueError(f"Unknown entity: '{entity}'. Use 'node' or 'edge'.")
+        return parser(args[1:])
 
-        if found_id is None:
-            raise ValueError("Missing required --id=<value>.")
-        return found_id, remaining
+    # ── Token parsers ────────────────────────────────────────────
 
     @staticmethod
-    def _extract_properties(tokens: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+    def _extract_entity_args(tokens: List[str],
+                             ignore_properties: bool = False,
+                             ) -> Tuple[str, Dict[str, Any], List[str]]:
         """
-        Extract --property Key=Value pairs from token list.
-        Returns (properties_dict, remaining_tokens).
+        Extract --id=<value> and --property Key=Value pairs in one pass.
+
+        Shared by the create / edit / delete parsers.  Both ``--id X`` and
+        ``--id=X`` are accepted (last one wins), as are ``--property K=V``
+        and ``--property=K=V``.  A bare ``--property`` takes the next token
+        that is not part of an ``--id`` argument.
+
+        With ``ignore_properties`` (used by delete) property tokens are
+        consumed but never validated.
+
+        Returns (id_value, properties_dict, remaining_tokens).
+
+        Raises:
+            ValueError: If --id is missing or a property is not Key=Value
+                        (a missing id is reported first).
         """
+        found_id = None
         props: Dict[str, Any] = {}
         remaining: List[str] = []
+        bad_property = None
+        awaiting_property = False
+        n = len(tokens)
         i = 0
-        while i < len(tokens):
+        while i < n:
             token = tokens[i]
-            if token == "--property" and i + 1 < len(tokens):
-                kv = tokens[i + 1]
-                eq_pos = kv.find("=")
-                if eq_pos == -1:
-                    raise ValueError(f"Invalid property format: '{kv}'. Expected Key=Value.")
-                key = kv[:eq_pos]
-                value = kv[eq_pos + 1:]
-                props[key] = value
+            if token.startswith("--id="):
+                found_id = token[5:]
+                i += 1
+                continue
+            if token == "--id" and i + 1 < n:
+                found_id = tokens[i + 1]
                 i += 2
                 continue
+            if awaiting_property:
+                kv = token
+                awaiting_property = False
+            elif token == "--property" and i + 1 < n:
+                awaiting_property = True
+                i += 1
+                continue
             elif token.startswith("--property="):
                 # --property=Key=Value (less common)
                 kv = token[11:]
-                eq_pos = kv.find("=")
-                if eq_pos == -1:
-                    raise ValueError(f"Invalid property format: '{kv}'. Expected Key=Value.")
-                key = kv[:eq_pos]
-                value = kv[eq_pos + 1:]
-                props[key] = value
             else:
                 remaining.append(token)
+                i += 1
+                continue
             i += 1
+            key, eq, value = kv.partition("=")
+            if not eq:
+                if bad_property is None:
+                    bad_property = kv
+                continue
+            props[key] = value
+        if awaiting_property:
+            # Only --id tokens followed a bare --property
+            remaining.append("--property")
 
-        return props, remaining
+        if found_id is None:
+            raise ValueError("Missing required --id=<value>.")
+        if bad_property is not None and not ignore_properties:
+            raise ValueError(f"Invalid property format: '{bad_property}'. Expected Key=Value.")
+        return found_id, props, remaining
 
     @staticmethod
     def _extract_query(tokens: List[str]) -> str:
@@ -355,13 +411,11 @@ class CommandProcessor:
     # ── Compound parsers ─────────────────────────────────────────
 
     def _parse_create_node(self, tokens: List[str]) -> CreateNodeCommand:
-        node_id, remaining = self._extract_id(tokens)
-        props, _ = self._extract_properties(remaining)
+        node_id, props, _ = self._extract_entity_args(tokens)
         return CreateNodeCommand(node_id, props)
 
     def _parse_create_edge(self, tokens: List[str]) -> CreateEdgeCommand:
-        edge_id, remaining = self._extract_id(tokens)
-        props, remaining = self._extract_properties(remaining)
+        edge_id, props, remaining = self._extract_entity_args(tokens)
 
         # Check for --directed / --undirected flags
         directed = True  # default
@@ -386,21 +440,19 @@ class CommandProcessor:
         return CreateEdgeCommand(edge_id, source_id, target_id, directed, props)
 
     def _parse_edit_node(self, tokens: List[str]) -> EditNodeCommand:
-        node_id, remaining = self._extract_id(tokens)
-        props, _ = self._extract_properties(remaining)
+        node_id, props, _ = self._extract_entity_args(tokens)
         if not props:
             raise ValueError("edit node requires at least one --property Key=Value.")
         return EditNodeCommand(node_id, props)
 
     def _parse_edit_edge(self, tokens: List[str]) -> EditEdgeCommand:
-        edge_id, remaining = self._extract_id(tokens)
-        props, _ = self._extract_properties(remaining)
+        edge_id, props, _ = self._extract_entity_args(tokens)
         if not props:
             raise ValueError("edit edge requires at least one --property Key=Value.")
         return EditEdgeCommand(edge_id, props)
 
     def _parse_delete(self, tokens: List[str], entity: str) -> Command:
-        entity_id, _ = self._extract_id(tokens)
+        entity_id, _, _ = self._extract_entity_args(tokens, ignore_properties=True)
         if entity == "node":
             return DeleteNodeCommand(entity_id)
         return DeleteEdgeCommand(entity_id)
@@ -80,6 +80,37 @@ class Command(ABC):
         """Whether this command can be undone."""
         return False
 
+    def undo(self, graph: Graph) -> CommandResult:
+        """
+        Reverse the last successful ``execute`` on ``graph``.
+
+        Commands keep just enough state from ``execute`` to do this, so
+        the invoker can record the command itself instead of a graph copy.
+        Commands without an inverse report a failed result.
+        """
+        return CommandResult(False, f"{type(self).__name__} cannot be undone.", graph)
+
+
+# Marks an attribute that did not exist before an edit
+_MISSING = object()
+
+
+def _save_attributes(entity, keys) -> Dict[str, tuple]:
+    """Record ``(value, type)`` of the attributes an edit command will overwrite."""
+    attributes, attribute_types = entity.attributes, entity.attribute_types
+    return {key: (attributes.get(key, _MISSING), attribute_types.get(key)) for key in keys}
+
+
+def _restore_attributes(entity, previous: Dict[str, tuple]) -> None:
+    """Put back the attributes saved by ``_save_attributes``."""
+    for key, (value, value_type) in previous.items():
+        if value is _MISSING:
+            entity.attributes.pop(key, None)
+            entity.attribute_types.pop(key, None)
+        else:
+            entity.attributes[key] = value
+            entity.attribute_types[key] = value_type
+
 
 # ═════════════════════════════════════════════════════════════════
 #  NODE COMMANDS
@@ -98,14 +129,14 @@ class CreateNodeCommand(Command):
         self._properties = properties or {}
 
     def execute(self, graph: Graph) -> CommandResult:
-        if graph.get_node(self._node_id) is not None:
+        if graph.contains_node(self._node_id):
             return CommandResult(
                 success=False,
                 message=f"Node '{self._node_id}' already exists.",
                 graph=graph,
             )
 
-        node = Node(self._node_id, **self._properties)
+        node = Node.from_attributes(self._node_id, self._properties)
         graph.add_node(node)
         return CommandResult(
             success=True,
@@ -113,6 +144,10 @@ class CreateNodeCommand(Command):
             graph=graph,
         )
 
+    def undo(self, graph: Graph) -> CommandResult:
+        graph.remove_node(self._node_id)
+        return CommandResult(True, f"Node '{self._node_id}' removed.", graph)
+
     @property
     def supports_undo(self) -> bool:
         return True
@@ -129,12 +164,14 @@ class EditNodeCommand(Command):
     def __init__(self, node_id: str, properties: Dict[str, Any]):
         self._node_id = str(node_id)
         self._new_properties = properties
+        self._previous: Dict[str, tuple] = {}  # key -> (old value, old type)
 
     def execute(self, graph: Graph) -> CommandResult:
         node = graph.get_node(self._node_id)
         if node is None:
             return CommandResult(False, f"Node '{self._node_id}' not found.", graph)
 
+        self._previous = _save_attributes(node, self._new_properties)
         for key, value in self._new_properties.items():
             node.set_attribute(key, value)
 
@@ -144,6 +181,10 @@ class EditNodeCommand(Command):
             graph,
         )
 
+    def undo(self, graph: Graph) -> CommandResult:
+        _restore_attributes(graph.get_node(self._node_id), self._previous)
+        return CommandResult(True, f"Node '{self._node_id}' restored.", graph)
+
     @property
     def supports_undo(self) -> bool:
         return True
@@ -160,6 +201,7 @@ class DeleteNodeCommand(Command):
 
     def __init__(self, node_id: str):
         self._node_id = str(node_id)
+        self._deleted: Optional[Node] = None
 
     def execute(self, graph: Graph) -> CommandResult:
         node = graph.get_node(self._node_id)
@@ -179,8 +221,13 @@ class DeleteNodeCommand(Command):
             )
 
         graph.remove_node(self._node_id)
+        self._deleted = node
         return CommandResult(True, f"Node '{self._node_id}' deleted.", graph)
 
+    def undo(self, graph: Graph) -> CommandResult:
+        graph.add_node(self._deleted)
+        return CommandResult(True, f"Node '{self._node_id}' restored.", graph)
+
     @property
     def supports_undo(self) -> bool:
         return True
@@ -217,11 +264,11 @@ class CreateEdgeCommand(Command):
         if target is None:
             return CommandResult(False, f"Target node '{self._target_id}' not found.", graph)
 
-        if graph.get_edge(self._edge_id) is not None:
+        if graph.contains_edge(self._edge_id):
             return CommandResult(False, f"Edge '{self._edge_id}' already exists.", graph)
 
         direction = EdgeDirection.DIRECTED if self._directed else EdgeDirection.UNDIRECTED
-        edge = Edge(self._edge_id, source, target, direction, **self._properties)
+        edge = Edge.from_attributes(self._edge_id, source, target, direction, self._properties)
         graph.add_edge(edge)
 
         arrow = "->" if self._directed else "--"
@@ -231,6 +278,10 @@ class CreateEdgeCommand(Command):
             graph,
         )
 
+    def undo(self, graph: Graph) -> CommandResult:
+        graph.remove_edge(self._edge_id)
+        return CommandResult(True, f"Edge '{self._edge_id}' removed.", graph)
+
     @property
     def supports_undo(self) -> bool:
         return True
@@ -247,12 +298,14 @@ class EditEdgeCommand(Command):
     def __init__(self, edge_id: str, properties: Dict[str, Any]):
         self._edge_id = str(edge_id)
         self._new_properties = properties
+        self._previous: Dict[str, tuple] = {}  # key -> (old value, old type)
 
     def execute(self, graph: Graph) -> CommandResult:
         edge = graph.get_edge(self._edge_id)
         if edge is None:
             return CommandResult(False, f"Edge '{self._edge_id}' not found.", graph)
 
+        self._previous = _save_attributes(edge, self._new_properties)
         for key, value in self._new_properties.items():
             edge.set_attribute(key, value)
 
@@ -262,6 +315,10 @@ class EditEdgeCommand(Command):
             graph,
         )
 
+    def undo(self, graph: Graph) -> CommandResult:
+        _restore_attributes(graph.get_edge(self._edge_id), self._previous)
+        return CommandResult(True, f"Edge '{self._edge_id}' restored.", graph)
+
     @property
     def supports_undo(self) -> bool:
         return True
@@ -277,6 +334,7 @@ class DeleteEdgeCommand(Command):
 
     def __init__(self, edge_id: str):
         self._edge_id = str(edge_id)
+        self._deleted: Optional[Edge] = None
 
     def execute(self, graph: Graph) -> CommandResult:
         edge = graph.get_edge(self._edge_id)
@@ -284,8 +342,13 @@ class DeleteEdgeCommand(Command):
             return CommandResult(False, f"Edge '{self._edge_id}' not found.", graph)
 
         graph.remove_edge(self._edge_id)
+        self._deleted = edge
         return CommandResult(True, f"Edge '{self._edge_id}' deleted.", graph)
 
+    def undo(self, graph: Graph) -> CommandResult:
+        graph.add_edge(self._deleted)
+        return CommandResult(True, f"Edge '{self._edge_id}' restored.", graph)
+
     @property
     def supports_undo(self) -> bool:
         return True
@@ -306,6 +369,7 @@ class FilterCommand(Command):
 
     def __init__(self, query: str):
         self._query = query
+        self._source: Optional[Graph] = None
 
     def execute(self, graph: Graph) -> CommandResult:
         from services.filter_service import FilterService
@@ -314,12 +378,10 @@ class FilterCommand(Command):
 
             # Support compound filters with && (AND) per SPECS §2.1.5
             # e.g.  filter 'Age>30 && Height>=150'
-            conditions = [c.strip() for c in self._query.split('&&')]
-            result_graph = graph
-            for condition in conditions:
-                if condition:
-                    result_graph = svc.filter(result_graph, condition)
+            conditions = [c for c in (c.strip() for c in self._query.split('&&')) if c]
+            result_graph = svc.filter_all(graph, conditions) if conditions else graph
 
+            self._source = graph
             return CommandResult(
                 True,
                 f"Filter '{self._query}' applied: "
@@ -330,6 +392,10 @@ class FilterCommand(Command):
         except Exception as e:
             return CommandResult(False, f"Filter error: {e}", graph)
 
+    def undo(self, graph: Graph) -> CommandResult:
+        # Filtering builds a new graph; the source graph was left untouched
+        return CommandResult(True, "Filter undone.", self._source)
+
 
 class SearchCommand(Command):
     """
@@ -343,12 +409,14 @@ class SearchCommand(Command):
 
     def __init__(self, query: str):
         self._query = query
+        self._source: Optional[Graph] = None
 
     def execute(self, graph: Graph) -> CommandResult:
         from services.search_service import SearchService
         try:
             svc = SearchService()
             result_graph = svc.search(graph, self._query)
+            self._source = graph
             return CommandResult(
                 True,
                 f"Search '{self._query}': "
@@ -359,6 +427,10 @@ class SearchCommand(Command):
         except Exception as e:
             return CommandResult(False, f"Search error: {e}", graph)
 
+    def undo(self, graph: Graph) -> CommandResult:
+        # Searching builds a new graph; the source graph was left untouched
+        return CommandResult(True, "Search undone.", self._source)
+
 
 # ═════════════════════════════════════════════════════════════════
 #  GRAPH-LEVEL COMMANDS
@@ -372,7 +444,13 @@ class ClearCommand(Command):
         clear
     """
 
+    def __init__(self):
+        self._nodes: List[Node] = []
+        self._edges: List[Edge] = []
+
     def execute(self, graph: Graph) -> CommandResult:
+        self._nodes = graph.get_all_nodes()
+        self._edges = graph.get_all_edges()
         for edge_id in list(graph.edges.keys()):
             graph.remove_edge(edge_id)
         for node_id in list(graph.nodes.keys()):
@@ -384,6 +462,11 @@ class ClearCommand(Command):
             graph,
         )
 
+    def undo(self, graph: Graph) -> CommandResult:
+        graph.add_nodes_bulk(self._nodes)
+        graph.add_edges_bulk(self._edges)
+        return CommandResult(True, "Graph restored.", graph)
+
     @property
     def supports_undo(self) -> bool:
         return True
@@ -435,44 +518,54 @@ class InfoCommand(Command):
         self._target_id = target_id
 
     def execute(self, graph: Graph) -> CommandResult:
-        if self._target_type is None:
-            # Graph summary
-            msg = (
-                f"Graph '{graph.graph_id}': "
-                f"{graph.get_number_of_nodes()} node(s), "
-                f"{graph.get_number_of_edges()} edge(s), "
-                f"has_cycle={graph.has_cycle()}"
-            )
-            return CommandResult(True, msg, graph)
-
-        if self._target_type == "node":
-            node = graph.get_node(self._target_id)
-            if node is None:
-                return CommandResult(False, f"Node '{self._target_id}' not found.", graph)
-            attrs_str = "\n".join(
-                f"  {k} = {v} ({node.attribute_types.get(k, '?').value if hasattr(node.attribute_types.get(k, '?'), 'value') else '?'})"
-                for k, v in node.attributes.items()
-            )
-            msg = f"Node '{self._target_id}':\n{attrs_str}" if attrs_str else f"Node '{self._target_id}': (no attributes)"
-            return CommandResult(True, msg, graph)
-
-        if self._target_type == "edge":
-            edge = graph.get_edge(self._target_id)
-            if edge is None:
-                return CommandResult(False, f"Edge '{self._target_id}' not found.", graph)
-            arrow = "->" if edge.is_directed() else "--"
-            attrs_str = "\n".join(
-                f"  {k} = {v}" for k, v in edge.attributes.items()
-            )
-            msg = (
-                f"Edge '{self._target_id}': "
-                f"{edge.source_node.node_id} {arrow} {edge.target_node.node_id}"
-            )
-            if attrs_str:
-                msg += f"\n{attrs_str}"
-            return CommandResult(True, msg, graph)
+        renderer = self._RENDERERS.get(self._target_type)
+        if renderer is None:
+            return CommandResult(False, f"Unknown target type: '{self._target_type}'.", graph)
+        return renderer(self, graph)
+
+    def _render_summary(self, graph: Graph) -> CommandResult:
+        msg = (
+            f"Graph '{graph.graph_id}': "
+            f"{graph.get_number_of_nodes()} node(s), "
+            f"{graph.get_number_of_edges()} edge(s), "
+            f"has_cycle={graph.has_cycle()}"
+        )
+        return CommandResult(True, msg, graph)
+
+    def _render_node(self, graph: Graph) -> CommandResult:
+        node = graph.get_node(self._target_id)
+        if node is None:
+            return CommandResult(False, f"Node '{self._target_id}' not found.", graph)
+        types = node.attribute_types
+        attrs_str = "\n".join(
+            f"  {k} = {v} ({types[k].value if k in types else '?'})"
+            for k, v in node.attributes.items()
+        )
+        msg = f"Node '{self._target_id}':\n{attrs_str}" if attrs_str else f"Node '{self._target_id}': (no attributes)"
+        return CommandResult(True, msg, graph)
+
+    def _render_edge(self, graph: Graph) -> CommandResult:
+        edge = graph.get_edge(self._target_id)
+        if edge is None:
+            return CommandResult(False, f"Edge '{self._target_id}' not found.", graph)
+        arrow = "->" if edge.is_directed() else "--"
+        attrs_str = "\n".join(
+            f"  {k} = {v}" for k, v in edge.attributes.items()
+        )
+        msg = (
+            f"Edge '{self._target_id}': "
+            f"{edge.source_node.node_id} {arrow} {edge.target_node.node_id}"
+        )
+        if attrs_str:
+            msg += f"\n{attrs_str}"
+        return CommandResult(True, msg, graph)
 
-        return CommandResult(False, f"Unknown target type: '{self._target_type}'.", graph)
+    # Target type → renderer (None is the graph summary)
+    _RENDERERS = {
+        None: _render_summary,
+        "node": _render_node,
+        "edge": _render_edge,
+    }
 
 
 class ListCommand(Command):
@@ -493,18 +586,18 @@ class ListCommand(Command):
 
         if self._target in (None, "nodes"):
             lines.append(f"── Nodes ({graph.get_number_of_nodes()}) ──")
-            for node in graph.get_all_nodes():
+            for node in graph.nodes.values():
                 attr_summary = ", ".join(f"{k}={v}" for k, v in node.attributes.items())
                 lines.append(f"  [{node.node_id}] {attr_summary}")
 
         if self._target in (None, "edges"):
             lines.append(f"── Edges ({graph.get_number_of_edges()}) ──")
-            for edge in graph.get_all_edges():
+            for edge in graph.edges.values():
                 arrow = "->" if edge.is_directed() else "--"
-                attr_summary = ", ".join(f"{k}={v}" for k, v in edge.attributes.items())
                 line = f"  [{edge.edge_id}] {edge.source_node.node_id} {arrow} {edge.target_node.node_id}"
-                if attr_summary:
-                    line += f"  ({attr_summary})"
+                if edge.attributes:
+                    attr_summary = ", ".join(f"{k}={v}" for k, v in edge.attributes.items())
+                    line = f"{line}  ({attr_summary})"
                 lines.append(line)
 
         msg = "\n".join(lines) if lines else "Graph is empty."
@@ -20,9 +20,10 @@
 import json
 import uuid
 import logging
+from collections import deque
 from copy import deepcopy
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Optional
 
 from api.models.graph import Graph
 
@@ -61,8 +62,9 @@ class Workspace:
 
         self._original_graph: Graph = deepcopy(graph)
         self._current_graph: Graph = deepcopy(graph)
-        self._history: List[Graph] = []
         self._max_history: int = max_history
+        # Bounded: appending past max_history drops the oldest snapshot
+        self._history: Deque[Graph] = deque(maxlen=max_history)
 
         # Services (injected by default; can be replaced for testing)
         self._filter_service = FilterService()
@@ -101,9 +103,7 @@ class Workspace:
 
         # Evaluate all conditions first so a parse/type error does not leave
         # the workspace in a partially-filtered state.
-        result_graph = self._current_graph
-        for condition in conditions:
-            result_graph = self._filter_service.filter(result_graph, condition)
+        result_graph = self._filter_service.filter_all(self._current_graph, conditions)
 
         self._push_snapshot()
         self._current_graph = result_graph
@@ -166,8 +166,6 @@ class Workspace:
 
     def _push_snapshot(self) -> None:
         """Save the current graph state before a mutation."""
-        if len(self._history) >= self._max_history:
-            self._history.pop(0)  # Drop oldest snapshot
         self._history.append(deepcopy(self._current_graph))
 
     def _pop_snapshot(self) -> None:
@@ -257,7 +255,10 @@ class Workspace:
         ws._original_graph = original_graph
         ws._current_graph = current_graph
         ws._max_history = data.get('max_history', 50)
-        ws._history = [serializer.deserialize(g) for g in data.get('history', [])]
+        ws._history = deque(
+            (serializer.deserialize(g) for g in data.get('history', [])),
+            maxlen=ws._max_history,
+        )
         ws._filter_service = FilterService()
         ws._search_service = SearchService()
 
@@ -3,7 +3,7 @@
 
     Design Pattern: Template Method
     ─────────────────────────────────
-    Defines the skeleton of a graph query operation (validate → execute → build subgraph),
+    Defines the skeleton of a graph query operation (validate → find → build subgraph),
     letting concrete subclasses (FilterService, SearchService) override specific steps.
 
     Genericity:
@@ -12,8 +12,9 @@
     enforcing type safety across the platform.
 """
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic, Set
+from typing import TypeVar, Generic, Iterable, Set
 from api.models.graph import Graph
+from api.models.node import Node
 
 # Generic type variable for the query parameter
 TQuery = TypeVar('TQuery')
@@ -27,6 +28,10 @@ class GraphQueryService(ABC, Generic[TQuery]):
     Concrete subclasses must implement:
         - _validate_query(query)   → raise on invalid input
         - _find_matching_nodes(graph, query) → set of matching node IDs
+
+    Subclasses that already hold the matching ``Node`` instances while
+    scanning may also override ``_find_matching(graph, query)`` so the
+    subgraph is built without an id → node round trip.
     """
 
     def execute(self, graph: Graph, query: TQuery) -> Graph:
@@ -42,8 +47,18 @@ class GraphQueryService(ABC, Generic[TQuery]):
             interconnecting edges.
         """
         self._validate_query(query)
+        matching_nodes = self._find_matching(graph, query)
+        return graph.get_subgraph_by_node_refs(matching_nodes)
+
+    def _find_matching(self, graph: Graph, query: TQuery) -> Iterable[Node]:
+        """
+        Return the matching nodes themselves (hook used by ``execute``).
+
+        Defaults to resolving the IDs from ``_find_matching_nodes``.
+        """
         matching_ids = self._find_matching_nodes(graph, query)
-        return graph.get_subgraph_by_nodes(matching_ids)
+        return [graph.nodes[node_id] for node_id in matching_ids
+                if node_id in graph.nodes]
 
     @abstractmethod
     def _validate_query(self, query: TQuery) -> None:
@@ -5,17 +5,80 @@
     Extends ``GraphQueryService[str]`` (Template Method + Genericity).
 """
 import re
-from typing import Set
+import sys
+from functools import lru_cache
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
 
 from api.models.graph import Graph
 from api.models.node import Node
-from api.types import TypeValidator
+from api.types import TypeValidator, ValueType
 from .base_service import GraphQueryService
 from .exceptions import FilterParseError, FilterTypeError
 
-# Regex: attribute  operator  value
-# Negative lookahead (?![><=!]) ensures >> or >< etc. are rejected
-_FILTER_PATTERN = re.compile(r'^\s*(\w+)\s*(==|!=|>=|<=|>(?![><=!])|<(?![><=!]))\s*(.+)\s*$')
+# Attribute names are plain identifiers; the operator is located by a
+# single left-to-right scan in _parse_filter (no regex backtracking)
+_ATTR_PATTERN = re.compile(r'\w+')
+_OPERATOR_CHARS = frozenset('=!<>')
+
+_COMPARISON_OPERATORS = frozenset({'==', '!=', '<', '<=', '>', '>='})
+
+# Sentinel for "attribute not present" (None is a valid attribute value)
+_MISSING = object()
+
+
+@lru_cache(maxsize=256, typed=True)
+def _compile_comparison(operator: str, target_val: Any) -> Optional[Callable[[Any], bool]]:
+    """
+    Generate ``lambda v: v <operator> target`` with the operator inlined.
+
+    Memoized per (operator, target value and its type), so a filter reused
+    across requests skips both code generation and operator dispatch.
+    Returns None for an operator outside ``_COMPARISON_OPERATORS``; callers
+    then use ``TypeValidator.compare``.
+    """
+    if operator not in _COMPARISON_OPERATORS:
+        return None
+    src = f"def _f(v, _t=_t):\n    return v {operator} _t\n"
+    namespace = {'_t': target_val}
+    exec(compile(src, '<filter>', 'exec'), namespace)
+    return namespace['_f']
+
+
+@lru_cache(maxsize=256)
+def _parse_filter(query: str) -> Optional[Tuple[str, str, str]]:
+    """
+    Split ``query`` into ``(attribute, operator, value)``.
+
+    Returns None when the query is malformed: no operator, a non-identifier
+    attribute, an empty value, or operator runs like ``>>``, ``><`` or ``=!``.
+    ``_validate_query`` turns that into ``FilterParseError``.
+
+    Cached per query string: UI re-filtering repeats the same few queries,
+    and each ``execute`` parses the query twice (validate, then match).
+    Malformed queries are cached too, as None.
+    """
+    for i, ch in enumerate(query):
+        if ch in _OPERATOR_CHARS:
+            break
+    else:
+        return None
+
+    pair = query[i:i + 2]
+    if pair in ('==', '!=', '>=', '<='):
+        operator = pair
+    elif ch in '<>' and (len(pair) < 2 or pair[1] not in _OPERATOR_CHARS):
+        operator = ch
+    else:
+        return None
+
+    attr_name = query[:i].strip()
+    target = query[i + len(operator):].strip()
+    if not target or '\n' in target or not _ATTR_PATTERN.fullmatch(attr_name):
+        return None
+    # Attribute keys set via keyword arguments are interned; interning the
+    # sliced name lets per-node dict lookups match on identity, and the
+    # interned operator hits the comparison caches the same way
+    return sys.intern(attr_name), sys.intern(operator), target
 
 
 class FilterService(GraphQueryService[str]):
@@ -26,8 +89,8 @@ class FilterService(GraphQueryService[str]):
     Extends ``GraphQueryService[str]`` — the generic base provides
     the Template Method ``execute(graph, query)`` which calls:
         1. ``_validate_query(query)``
-        2. ``_find_matching_nodes(graph, query)``
-        3. ``graph.get_subgraph_by_nodes(matching_ids)``
+        2. ``_find_matching(graph, query)``
+        3. ``graph.get_subgraph_by_node_refs(matching_nodes)``
     """
 
     # ── Public convenience method (backward-compatible) ──────────
@@ -44,27 +107,97 @@ class FilterService(GraphQueryService[str]):
         """
         return self.execute(graph, query)
 
+    def filter_all(self, graph: Graph, queries: Iterable[str]) -> Graph:
+        """
+        Apply several filters as a conjunction (``Age > 30 && City == Paris``).
+
+        Same result as chaining ``filter`` calls, but each query only scans
+        the nodes that passed the previous ones and the subgraph is built
+        once instead of once per query.
+
+        :raises FilterParseError: If any query is None, empty, or has invalid syntax
+        :raises FilterTypeError: If a value cannot be compared with the attribute type
+        """
+        nodes: Iterable[Node] = graph.nodes.values()
+        for query in queries:
+            self._validate_query(query)
+            nodes = self._match_nodes(nodes, query)
+        return graph.get_subgraph_by_node_refs(nodes)
+
     # ── Template Method hooks (from GraphQueryService[str]) ──────
 
     def _validate_query(self, query: str) -> None:
         """Validate that the filter query is non-empty and syntactically correct."""
         if query is None or not query.strip():
             raise FilterParseError("Filter query cannot be empty.")
-        if not _FILTER_PATTERN.match(query):
+        if _parse_filter(query) is None:
             raise FilterParseError("Invalid filter format.")
 
     def _find_matching_nodes(self, graph: Graph, query: str) -> Set[str]:
         """Return IDs of all nodes whose attribute satisfies the filter."""
-        match = _FILTER_PATTERN.match(query)
-        attr_name = match.group(1)
-        operator = match.group(2)
-        target_value_str = match.group(3).strip()
-
-        matching_ids = set()
-        for node in graph.get_all_nodes():
-            if self._evaluate_node(node, attr_name, operator, target_value_str):
-                matching_ids.add(node.node_id)
-        return matching_ids
+        return {node.node_id for node in self._find_matching(graph, query)}
+
+    def _find_matching(self, graph: Graph, query: str) -> List[Node]:
+        """Return all nodes whose attribute satisfies the filter, in graph order."""
+        return self._match_nodes(graph.nodes.values(), query)
+
+    def _match_nodes(self, nodes: Iterable[Node], query: str) -> List[Node]:
+        """Return the nodes (in the given order) whose attribute satisfies the filter."""
+        attr_name, operator, target_value_str = _parse_filter(query)
+
+        # One predicate per attribute type seen: the target is converted
+        # once per type rather than once per node.
+        predicates: Dict[Optional[ValueType], Optional[Callable[[Any], bool]]] = {}
+        matching = []
+        for node in nodes:
+            node_val = node.attributes.get(attr_name, _MISSING)
+            if node_val is _MISSING:
+                continue
+            attr_type = node.attribute_types.get(attr_name)
+            try:
+                predicate = predicates[attr_type]
+            except KeyError:
+                predicate = predicates[attr_type] = self._build_predicate(
+                    attr_name, attr_type, operator, target_value_str)
+
+            if predicate is None:
+                matched = self._evaluate_node(node, attr_name, operator, target_value_str)
+            else:
+                try:
+                    matched = predicate(node_val)
+                except TypeError:
+                    # Re-run the interpreted path for its error message
+                    matched = self._evaluate_node(node, attr_name, operator, target_value_str)
+            if matched:
+                matching.append(node)
+        return matching
+
+    def _build_predicate(self, attr_name: str, attr_type: Optional[ValueType],
+                         operator: str, target_value_str: str
+                         ) -> Optional[Callable[[Any], bool]]:
+        """
+        Return a compiled comparison for attributes of ``attr_type``,
+        or None if nodes of this type must go through ``_evaluate_node``.
+
+        :raises FilterTypeError: If the value cannot be converted to the attribute's type
+        """
+        # Boolean ordering is rejected by TypeValidator.compare; keep that path
+        if attr_type is ValueType.BOOL and operator not in ('==', '!='):
+            return None
+        try:
+            target_val = TypeValidator.convert_to_type(target_value_str, attr_type)
+        except TypeError as e:
+            raise FilterTypeError(str(e))
+        except ValueError:
+            raise FilterTypeError(
+                f"Value '{target_value_str}' is incompatible with "
+                f"the type of attribute '{attr_name}' ({attr_type.value})."
+            )
+        try:
+            return _compile_comparison(operator, target_val)
+        except TypeError:
+            # Unhashable target value — cannot be memoized
+            return None
 
     def _evaluate_node(self, node: Node, attr_name: str,
                        operator: str, target_value_str: str) -> bool:
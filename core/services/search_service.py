@@ -5,9 +5,10 @@
     Extends ``GraphQueryService[str]`` (Template Method + Genericity).
 """
 import re
-from typing import Set
+from typing import Any, Dict, List, Set
 
 from api.models.graph import Graph
+from api.models.node import Node
 from .base_service import GraphQueryService
 from .exceptions import SearchParseError
 
@@ -24,8 +25,8 @@ class SearchService(GraphQueryService[str]):
     Extends ``GraphQueryService[str]`` — the generic base provides
     the Template Method ``execute(graph, query)`` which calls:
         1. ``_validate_query(query)``
-        2. ``_find_matching_nodes(graph, query)``
-        3. ``graph.get_subgraph_by_nodes(matching_ids)``
+        2. ``_find_matching(graph, query)``
+        3. ``graph.get_subgraph_by_node_refs(matching_nodes)``
     """
 
     # ── Public convenience method (backward-compatible) ──────────
@@ -54,8 +55,12 @@ class SearchService(GraphQueryService[str]):
         Supports OR logic via '|' separator, e.g. ``"name | role"`` returns
         nodes matching either term.
         """
+        return {node.node_id for node in self._find_matching(graph, query)}
+
+    def _find_matching(self, graph: Graph, query: str) -> List[Node]:
+        """Return all nodes matching the search query (OR over '|' terms)."""
         terms = [t.strip() for t in query.split('|')]
-        matching_ids: Set[str] = set()
+        matching: Dict[str, Node] = {}
         for term in terms:
             if not term:
                 continue
@@ -63,41 +68,69 @@ class SearchService(GraphQueryService[str]):
             if match:
                 attr_name = match.group(1)
                 search_value = match.group(2).strip()
-                matching_ids |= self._find_by_value(graph, attr_name, search_value)
+                found = self._find_by_value(graph, attr_name, search_value)
             else:
-                matching_ids |= self._find_by_name(graph, term)
-        return matching_ids
+                found = self._find_by_name(graph, term)
+            for node in found:
+                matching.setdefault(node.node_id, node)
+        return list(matching.values())
 
-    def _find_by_name(self, graph: Graph, query: str) -> Set[str]:
+    def _find_by_name(self, graph: Graph, query: str) -> List[Node]:
         """
-        Return IDs of nodes where query appears in attribute name or value
+        Return nodes where query appears in attribute name or value
         (case-insensitive).
         """
-        query_lower = query.lower()
-        matching_ids = set()
-
-        for node in graph.get_all_nodes():
+        query_cf = query.casefold()
+        matching = []
+        # Attribute names and string values repeat across nodes;
+        # test each distinct one once
+        key_hits: Dict[str, bool] = {}
+        value_hits: Dict[str, bool] = {}
+
+        for node in graph.nodes.values():
             for key, attr_val in node.attributes.items():
-                if query_lower in key.lower():
-                    matching_ids.add(node.node_id)
-                    break
-                if attr_val is not None and query_lower in str(attr_val).lower():
-                    matching_ids.add(node.node_id)
+                hit = key_hits.get(key)
+                if hit is None:
+                    hit = key_hits[key] = query_cf in key.casefold()
+                if hit or self._value_contains(attr_val, query_cf, value_hits):
+                    matching.append(node)
                     break
 
-        return matching_ids
+        return matching
 
-    def _find_by_value(self, graph: Graph, attr_name: str, value: str) -> Set[str]:
-        """Return IDs of nodes where attribute 'attr_name' contains 'value' (case-insensitive)."""
-        attr_lower = attr_name.lower()
-        value_lower = value.lower()
+    def _find_by_value(self, graph: Graph, attr_name: str, value: str) -> List[Node]:
+        """Return nodes where attribute 'attr_name' contains 'value' (case-insensitive)."""
+        attr_cf = attr_name.casefold()
+        value_cf = value.casefold()
 
-        matching_ids = set()
-        for node in graph.get_all_nodes():
+        matching = []
+        key_hits: Dict[str, bool] = {}
+        value_hits: Dict[str, bool] = {}
+        for node in graph.nodes.values():
             for key, attr_val in node.attributes.items():
-                if key.lower() == attr_lower:
-                    if attr_val is not None and value_lower in str(attr_val).lower():
-                        matching_ids.add(node.node_id)
-                        break
+                hit = key_hits.get(key)
+                if hit is None:
+                    hit = key_hits[key] = key.casefold() == attr_cf
+                if hit and self._value_contains(attr_val, value_cf, value_hits):
+                    matching.append(node)
+                    break
 
-        return matching_ids
+        return matching
+
+    @staticmethod
+    def _value_contains(attr_val: Any, needle_cf: str, str_hits: Dict[str, bool]) -> bool:
+        """
+        Case-insensitive substring test of ``needle_cf`` in ``attr_val``.
+
+        Results for string values are cached in ``str_hits``; other types
+        are not, since ``1``, ``1.0`` and ``True`` are equal dict keys but
+        render differently.
+        """
+        if attr_val is None:
+            return False
+        if type(attr_val) is not str:
+            return needle_cf in str(attr_val).casefold()
+        hit = str_hits.get(attr_val)
+        if hit is None:
+            hit = str_hits[attr_val] = needle_cf in attr_val.casefold()
+        return hit
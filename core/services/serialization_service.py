@@ -13,9 +13,9 @@
         Graph.from_dict  →  GraphSerializer.deserialize
 """
 import json
-from copy import deepcopy
 from datetime import date, datetime
-from typing import Any, Dict, Optional, Type
+from functools import lru_cache
+from typing import Any, Callable, Dict, Optional, Tuple, Type
 
 from api.models.graph import Graph
 from api.models.node import Node
@@ -24,6 +24,9 @@ from api.types import ValueType, TypeValidator
 
 from graph_platform.config import SerializationConfig
 
+# Attribute value types that serialize as-is (no copy, no formatting)
+_PASSTHROUGH_TYPES = (str, int, float, bool)
+
 
 class GraphSerializer:
     """
@@ -120,8 +123,8 @@ class GraphSerializer:
 
     def _format_value(self, value: Any) -> Any:
         """Format a single value for serialization (handles dates)."""
-        if value is None:
-            return None
+        if value is None or type(value) in _PASSTHROUGH_TYPES:
+            return value
         if isinstance(value, (date, datetime)):
             if self._config.date_format == "iso":
                 return value.isoformat()
@@ -198,21 +201,45 @@ class GraphSerializer:
         If type hints are absent, ``TypeValidator.detect_type`` is used
         as a fallback (the Node/Edge constructor will handle this).
         """
+        try:
+            plan = _conversion_plan(tuple(type_hints.items()))
+        except TypeError:
+            # Unhashable hints cannot be cached — build the plan directly
+            plan = _conversion_plan.__wrapped__(tuple(type_hints.items()))
+
         result: Dict[str, Any] = {}
         for key, value in raw_attrs.items():
-            if value is None:
-                result[key] = None
+            converter = plan.get(key)
+            if value is None or converter is None:
+                # None stays None; unhinted values are auto-detected
+                # by the Node/Edge constructor
+                result[key] = value
                 continue
 
-            hint = type_hints.get(key)
-            if hint:
-                try:
-                    target_type = ValueType(hint)
-                    result[key] = TypeValidator.convert_to_type(value, target_type)
-                except (ValueError, KeyError):
-                    result[key] = value
-            else:
-                # Let the Node/Edge constructor auto-detect
+            try:
+                result[key] = converter(value)
+            except ValueError:
                 result[key] = value
 
         return result
+
+
+@lru_cache(maxsize=256)
+def _conversion_plan(hint_items: Tuple[Tuple[str, str], ...]) -> Dict[str, Callable[[Any], Any]]:
+    """
+    Resolve a ``types`` mapping into ``{key: converter}`` once.
+
+    Nodes and edges of one graph usually share a handful of distinct
+    type-hint dicts, so caching the plan avoids re-parsing every hint
+    into a ``ValueType`` for each deserialized element.  Unknown hints
+    are left out of the plan, which keeps the raw value.
+    """
+    plan: Dict[str, Callable[[Any], Any]] = {}
+    for key, hint in hint_items:
+        if not hint:
+            continue
+        try:
+            plan[key] = TypeValidator.get_converter(ValueType(hint))
+        except ValueError:
+            continue
+    return plan
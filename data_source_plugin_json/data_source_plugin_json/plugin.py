@@ -1,16 +1,21 @@
 import json
 import uuid
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, List, Optional, Set, Tuple
 
 from api.plugins import DataSourcePlugin, ParameterDef
 from api.models.graph import Graph
 from api.models.edge import Edge, EdgeDirection
 from api.models.node import Node
 
+try:
+    import orjson
+except ImportError:  # optional speed-up; stdlib json is used without it
+    orjson = None
+
 
 class JSONNode(Node):
     """Concrete Node implementation for JSON-sourced data."""
-    pass
+    __slots__ = ()
 
 
 class JsonDataSourcePlugin(DataSourcePlugin):
@@ -42,8 +47,7 @@ class JsonDataSourcePlugin(DataSourcePlugin):
             )
         id_attr: str = kwargs.get('id_attr') or "@id"
 
-        with open(file_path, "r", encoding="utf-8") as fh:
-            data = json.load(fh)
+        data = self._load_json(file_path)
 
         graph = Graph(graph_id=file_path)
 
@@ -55,6 +59,8 @@ class JsonDataSourcePlugin(DataSourcePlugin):
 
         visited: Set[str] = set()
         edge_counter = [0]
+        # (source id, target id, label) of every edge added so far
+        edge_keys: Set[Tuple[str, str, str]] = set()
         for root in roots:
             self._parse_object(
                 obj=root,
@@ -62,6 +68,7 @@ class JsonDataSourcePlugin(DataSourcePlugin):
                 id_registry=id_registry,
                 visited=visited,
                 edge_counter=edge_counter,
+                edge_keys=edge_keys,
                 parent_node=None,
                 edge_label=None,
                 id_attr=id_attr,
@@ -69,6 +76,24 @@ class JsonDataSourcePlugin(DataSourcePlugin):
 
         return graph
 
+    @staticmethod
+    def _load_json(file_path: str) -> Any:
+        """
+        Read and decode the JSON document, with orjson when it is installed.
+
+        orjson rejects a few inputs the stdlib accepts (NaN/Infinity, integers
+        beyond 64 bits); those fall back to ``json.loads``, which also raises
+        the usual ``json.JSONDecodeError`` for documents that are invalid.
+        """
+        with open(file_path, "r", encoding="utf-8") as fh:
+            text = fh.read()
+        if orjson is not None:
+            try:
+                return orjson.loads(text)
+            except orjson.JSONDecodeError:
+                pass
+        return json.loads(text)
+
     # ── pass 1: collect all id_attr values ───────────────────────────────────
 
     def _collect_ids(self, obj: Any, registry: Dict[str, Any], id_attr: str) -> None:
@@ -91,6 +116,7 @@ class JsonDataSourcePlugin(DataSourcePlugin):
         id_registry: Dict[str, Any],
         visited: Set[str],
         edge_counter: List[int],
+        edge_keys: Set[Tuple[str, str, str]],
         parent_node: Optional[JSONNode],
         edge_label: Optional[str],
         id_attr: str = "@id",
@@ -115,7 +141,7 @@ class JsonDataSourcePlugin(DataSourcePlugin):
 
         # Connect to parent
         if parent_node is not None and edge_label is not None:
-            self._add_edge(graph, edge_counter, parent_node, current_node, edge_label)
+            self._add_edge(graph, edge_counter, edge_keys, parent_node, current_node, edge_label)
 
         # Guard against infinite recursion on cycles
         if node_id in visited:
@@ -130,25 +156,25 @@ class JsonDataSourcePlugin(DataSourcePlugin):
             if isinstance(value, dict):
                 # Nested object → child node
                 self._parse_object(value, graph, id_registry, visited,
-                                   edge_counter, current_node, key, id_attr)
+                                   edge_counter, edge_keys, current_node, key, id_attr)
 
             elif isinstance(value, list):
                 for item in value:
                     if isinstance(item, dict):
                         self._parse_object(item, graph, id_registry, visited,
-                                           edge_counter, current_node, key, id_attr)
+                                           edge_counter, edge_keys, current_node, key, id_attr)
                     elif isinstance(item, str) and item in id_registry:
                         target = self._resolve_reference(
-                            item, graph, id_registry, visited, edge_counter, id_attr)
+                            item, graph, id_registry, visited, edge_counter, edge_keys, id_attr)
                         if target is not None:
-                            self._add_edge(graph, edge_counter, current_node, target, key)
+                            self._add_edge(graph, edge_counter, edge_keys, current_node, target, key)
 
             elif isinstance(value, str) and value in id_registry:
                 # String reference to another node (via id_attr) → edge, not attribute
                 target = self._resolve_reference(
-                    value, graph, id_registry, visited, edge_counter, id_attr)
+                    value, graph, id_registry, visited, edge_counter, edge_keys, id_attr)
                 if target is not None:
-                    self._add_edge(graph, edge_counter, current_node, target, key)
+                    self._add_edge(graph, edge_counter, edge_keys, current_node, target, key)
 
         return current_node
 
@@ -159,6 +185,7 @@ class JsonDataSourcePlugin(DataSourcePlugin):
         id_registry: Dict[str, Any],
         visited: Set[str],
         edge_counter: List[int],
+        edge_keys: Set[Tuple[str, str, str]],
         id_attr: str = "@id",
     ) -> Optional[JSONNode]:
         """Return the node for ref_id, creating it first if necessary."""
@@ -170,6 +197,7 @@ class JsonDataSourcePlugin(DataSourcePlugin):
                 id_registry=id_registry,
                 visited=visited,
                 edge_counter=edge_counter,
+                edge_keys=edge_keys,
                 parent_node=None,
                 edge_label=None,
                 id_attr=id_attr,
@@ -199,16 +227,18 @@ class JsonDataSourcePlugin(DataSourcePlugin):
     def _add_edge(
         graph: Graph,
         edge_counter: List[int],
+        edge_keys: Set[Tuple[str, str, str]],
         source: JSONNode,
         target: JSONNode,
         label: str,
     ) -> None:
         """Add a directed edge, skipping exact duplicates."""
-        # Avoid duplicate edges (can happen when a cycle is first resolved)
-        for existing in graph.get_outgoing_edges(source):
-            if (existing.target_node.node_id == target.node_id
-                    and existing.get_attribute("label") == label):
-                return
+        # Avoid duplicate edges (can happen when a cycle is first resolved);
+        # a set lookup instead of rescanning the source's outgoing edges
+        key = (source.node_id, target.node_id, label)
+        if key in edge_keys:
+            return
+        edge_keys.add(key)
 
         eid = f"e{edge_counter[0]}_{label}"
         edge_counter[0] += 1
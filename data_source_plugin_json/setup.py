@@ -8,6 +8,9 @@ setup(
     install_requires=[
         'graph-visualizer-api',
     ],
+    extras_require={
+        'fast': ['orjson>=3.0'],
+    },
     entry_points={
         'graph_visualizer.data_source': [
             'json = data_source_plugin_json.plugin:JsonDataSourcePlugin',
@@ -1,3 +1,7 @@
+import sys
+from collections import defaultdict
+from functools import lru_cache
+
 from rdflib import Graph as RDFGraph, URIRef, Literal
 from rdflib.namespace import RDF
 
@@ -8,9 +12,19 @@ from api.models.graph import Graph
 from api.models.edge import Edge, EdgeDirection
 from api.models.node import Node
 
+
+@lru_cache(maxsize=4096)
+def _local_name(uri: str) -> str:
+    """Extract the local fragment from a URI (after # or last /)."""
+    head, sep, tail = uri.rpartition("#")
+    if sep:
+        return tail
+    return uri.rstrip("/").rpartition("/")[2]
+
+
 class RDFNode(Node):
     """Concrete Node implementation for RDF-sourced data."""
-    pass
+    __slots__ = ()
 
 
 class RDFTurtleDataSourcePlugin(DataSourcePlugin):
@@ -37,61 +51,59 @@ class RDFTurtleDataSourcePlugin(DataSourcePlugin):
 
         graph = Graph(graph_id=file_path)
 
-        # --- Pass 1: collect all URI subjects and objects as nodes ---
-        node_uris: set[str] = set()
-        for subject, predicate, obj in rdf_graph:
-            if isinstance(subject, URIRef):
-                node_uris.add(str(subject))
-            if isinstance(obj, URIRef) and predicate != RDF.type:
-                node_uris.add(str(obj))
-
-        for uri in node_uris:
-            label = self._local_name(uri)
-            literal_attrs = self._extract_literal_attributes(rdf_graph, URIRef(uri))
-            node = RDFNode(node_id=uri, label=label, **literal_attrs)
-            graph.add_node(node)
-
-        # --- Pass 2: URI-object triples (excluding rdf:type) become edges ---
-        edge_counter = 0
+        # --- Single pass: collect node URIs, literal attributes and edges ---
+        # Exact type checks: the Turtle parser only produces plain URIRef and
+        # Literal terms, and `type(x) is` is cheaper than isinstance per triple
+        uri_ref, literal, rdf_type = URIRef, Literal, RDF.type
+        # URIs repeat across triples; interning keeps one str object per URI
+        intern = sys.intern
+        node_uris: dict[str, None] = {}
+        literals: dict[str, dict] = defaultdict(dict)
+        edge_triples: list[tuple[str, tuple[str, str], str]] = []
+        # Per distinct predicate term: (interned URI string, local name)
+        predicates: dict[URIRef, tuple[str, str]] = {}
         for subject, predicate, obj in rdf_graph:
-            if isinstance(subject, URIRef) and isinstance(obj, URIRef):
-                if predicate == RDF.type:
-                    continue
-
-                source_node = graph.get_node(str(subject))
-                target_node = graph.get_node(str(obj))
-
-                if source_node is None or target_node is None:
-                    continue
-
-                edge_id = f"e{edge_counter}_{self._local_name(str(predicate))}"
-                edge = Edge(
-                    edge_id=edge_id,
-                    source_node=source_node,
-                    target_node=target_node,
-                    direction=EdgeDirection.DIRECTED,
-                    predicate=str(predicate),
-                    label=self._local_name(str(predicate))
-                )
-                graph.add_edge(edge)
-                edge_counter += 1
+            subject_uri = intern(str(subject)) if type(subject) is uri_ref else None
+            if subject_uri is not None:
+                node_uris[subject_uri] = None
+            obj_type = type(obj)
+            if obj_type is uri_ref:
+                if predicate != rdf_type:
+                    obj_uri = intern(str(obj))
+                    node_uris[obj_uri] = None
+                    if subject_uri is not None:
+                        info = predicates.get(predicate) or self._predicate_info(predicates, predicate)
+                        edge_triples.append((subject_uri, info, obj_uri))
+            elif subject_uri is not None and obj_type is literal:
+                key = (predicates.get(predicate) or self._predicate_info(predicates, predicate))[1]
+                literals[subject_uri][key] = str(obj)
+
+        uri_to_node: dict[str, RDFNode] = {
+            uri: RDFNode(node_id=uri, label=_local_name(uri), **literals.get(uri, {}))
+            for uri in node_uris
+        }
+
+        # --- URI-object triples (excluding rdf:type) become edges ---
+        edges = []
+        for edge_counter, (subject_uri, (predicate_uri, local), obj_uri) in enumerate(edge_triples):
+            edge = Edge.from_attributes(
+                f"e{edge_counter}_{local}",
+                uri_to_node[subject_uri],
+                uri_to_node[obj_uri],
+                EdgeDirection.DIRECTED,
+                {'predicate': predicate_uri, 'label': local}
+            )
+            edges.append(edge)
+        graph.bulk_load(uri_to_node.values(), edges)
 
         return graph
 
-    def _local_name(self, uri: str) -> str:
-        """Extract the local fragment from a URI (after # or last /)."""
-        if "#" in uri:
-            return uri.split("#")[-1]
-        return uri.rstrip("/").split("/")[-1]
-
-    def _extract_literal_attributes(self, rdf_graph: RDFGraph, uri: URIRef) -> dict:
-        """Collect all Literal property values for a URI as a flat dict."""
-        attributes = {}
-        for predicate, obj in rdf_graph.predicate_objects(uri):
-            if isinstance(obj, Literal):
-                key = self._local_name(str(predicate))
-                attributes[key] = str(obj)
-        return attributes
+    @staticmethod
+    def _predicate_info(cache: dict, predicate: URIRef) -> tuple[str, str]:
+        """Compute and cache ``(uri, local name)`` for a predicate not seen yet."""
+        uri = sys.intern(str(predicate))
+        info = cache[predicate] = (uri, _local_name(uri))
+        return info
 
 
 def print_test_data():
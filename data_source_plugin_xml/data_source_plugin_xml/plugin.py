@@ -4,18 +4,95 @@ from api.models.graph import Graph
 from api.models.edge import Edge, EdgeDirection
 from api.models.node import Node
 
+import os
+import re
+import sys
+from collections import defaultdict
+from functools import lru_cache
 from lxml import etree
-from typing import Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Files at least this large are parsed with iterparse instead of a full DOM
+_STREAMING_THRESHOLD_BYTES = 32 * 1024 * 1024
+
+# "auto" picks by file size; "dom" / "iterparse" force one parser
+_PARSE_MODES = frozenset({"auto", "dom", "iterparse"})
+
+# One step of an absolute reference path, e.g. ``Person`` or ``Person[2]``
+_PATH_STEP = re.compile(r'([A-Za-z_][\w.\-]*)(?:\[([1-9]\d*)\])?')
+
+
+@lru_cache(maxsize=4096)
+def _localname(tag: str) -> str:
+    """
+    Local part of an element tag (``{ns}local`` -> ``local``), interned.
+
+    Documents use few distinct tags, so this is nearly always a cache hit
+    instead of building an ``etree.QName`` per element.
+    """
+    if not isinstance(tag, str):
+        # Comments / processing instructions: let QName raise as before
+        return etree.QName(tag).localname
+    return sys.intern(tag.rpartition('}')[2])
+
+
+@lru_cache(maxsize=256)
+def _compile_xpath(xpath: str) -> etree.XPath:
+    """Compiled form of a reference ``xpath``, shared across references and parses."""
+    return etree.XPath(xpath)
 
 
 class XMLNode(Node):
-    pass
+    __slots__ = ()
+
+
+class _StreamingUnsupported(Exception):
+    """The document needs the DOM parser (e.g. a reference XPath beyond simple paths)."""
+
+
+class _StreamFrame:
+    """State kept for each open element while streaming."""
+
+    __slots__ = ('seq', 'label', 'attrib', 'node_id', 'node', 'skip',
+                 'child_count', 'first_child_ref', 'pending', 'text')
+
+    def __init__(self, element: etree._Element, seq: int, node_id: Optional[str], skip: bool):
+        self.seq = seq
+        self.label = _localname(element.tag)
+        self.attrib = dict(element.attrib)
+        self.node_id = node_id
+        self.node: Optional[Node] = None
+        self.skip = skip
+        self.child_count = 0
+        # Reference XPath of the first child, if that child carries ref_attr
+        self.first_child_ref: Optional[str] = None
+        # Finished first child whose handling waits until we know whether
+        # this element is a reference wrapper or a node
+        self.pending: Optional['_StreamFrame'] = None
+        self.text = ''
+
 
 class XmlDataSourcePlugin(DataSourcePlugin):
     """
     DataSourcePlugin for XML files.
     """
 
+    def __init__(self, mode: str = "auto"):
+        """
+        :param mode: ``"auto"`` streams files of at least
+            ``_STREAMING_THRESHOLD_BYTES`` and loads smaller ones as a DOM;
+            ``"dom"`` or ``"iterparse"`` force one parser. Documents the
+            streaming parser cannot handle always fall back to the DOM.
+        :raises ValueError: If ``mode`` is not one of the above
+        """
+        if mode not in _PARSE_MODES:
+            raise ValueError(
+                f"Unknown XML parse mode '{mode}'. "
+                f"Expected one of: {', '.join(sorted(_PARSE_MODES))}."
+            )
+        self._mode = mode
+
     def get_plugin_name(self) -> str:
         return "XML Parser"
 
@@ -43,156 +120,392 @@ class XmlDataSourcePlugin(DataSourcePlugin):
             )
         ref_attr: str = kwargs.get('ref_attr') or "reference"
 
-        parser = etree.XMLParser(resolve_entities=False, no_network=True, remove_comments=True)
+        if self._mode == "iterparse" or (self._mode == "auto" and self._is_large_file(file_path)):
+            try:
+                return self._parse_streaming(file_path, ref_attr)
+            except _StreamingUnsupported:
+                pass
+        return self._parse_dom(file_path, ref_attr)
+
+    def _is_large_file(self, file_path: str) -> bool:
+        try:
+            return os.path.getsize(file_path) >= _STREAMING_THRESHOLD_BYTES
+        except (OSError, TypeError):
+            # Let the DOM parser report missing files
+            return False
+
+    def _parse_dom(self, file_path: str, ref_attr: str) -> Graph:
+        """Parse the whole document into memory, then build the graph."""
+        parser = etree.XMLParser(resolve_entities=False, no_network=True, remove_comments=True,
+                                 huge_tree=True)
         tree = etree.parse(file_path, parser)
+        if tree.docinfo.internalDTD is not None:
+            # Unresolved entity references are not elements; drop them, keeping surrounding text
+            etree.strip_tags(tree, etree.Entity)
         root = tree.getroot()
 
         graph = Graph(graph_id=file_path)
 
-        id_map = {}
-        self._assign_node_ids(tree, root, id_map, {}, ref_attr)
+        id_map = self._assign_node_ids(root, ref_attr)
 
-        connection_map = {}
-        self._build_graph(graph, tree, root, id_map, connection_map, ref_attr)
+        nodes: List[Node] = []
+        edges: List[Edge] = []
+        connection_map: Dict[Node, List[Tuple[str, str]]] = {}
+        self._build_graph(nodes, edges, root, id_map, connection_map, ref_attr)
+        self._add_reference_edges(nodes, edges, connection_map)
 
-        for source_key, connections in connection_map.items():
-            source_node = graph.get_node(source_key)
+        graph.bulk_load(nodes, edges)
+        return graph
+
+    def _parse_streaming(self, file_path: str, ref_attr: str) -> Graph:
+        """
+        Build the same graph as ``_parse_dom`` from ``iterparse`` events.
+
+        Elements are cleared as soon as they end, so the full DOM is never
+        held in memory. Node ids are assigned on ``start`` events (document
+        order, as in ``_assign_node_ids``); child handling happens on ``end``
+        events. References are resolved afterwards against a compact
+        ``(parent, tag) -> children`` index.
+
+        :raises _StreamingUnsupported: If the document uses something only the
+            DOM path handles, such as a reference XPath other than a simple
+            absolute path or an unresolved entity reference.
+        """
+        graph = Graph(graph_id=file_path)
+
+        tag_count: Dict[str, int] = defaultdict(int)
+        element_ids: List[Optional[str]] = []
+        children_index: Dict[Tuple[int, str], List[int]] = {}
+        root_tag: Optional[str] = None
+        references: List[Tuple[Node, str, str]] = []
+        stack: List[_StreamFrame] = []
+        nodes: List[Node] = []
+        edges: List[Edge] = []
+
+        context = etree.iterparse(file_path, events=('start', 'end', 'pi'),
+                                  resolve_entities=False, no_network=True, remove_comments=True,
+                                  huge_tree=True)
+        for event, element in context:
+            if event == 'pi':
+                # Processing instructions count as children in the DOM walk
+                if stack:
+                    raise _StreamingUnsupported()
+                continue
+
+            if event == 'start':
+                seq = len(element_ids)
+                parent = stack[-1] if stack else None
+                has_ref = ref_attr in element.attrib
+
+                if parent is None:
+                    if has_ref:
+                        raise _StreamingUnsupported()
+                    root_tag = element.tag
+                else:
+                    parent.child_count += 1
+                    children_index.setdefault((parent.seq, element.tag), []).append(seq)
+                    if parent.child_count == 1 and has_ref:
+                        parent.first_child_ref = element.attrib[ref_attr]
+                    if (not parent.skip and parent.node is None
+                            and (parent.child_count > 1 or not has_ref)):
+                        # Not a reference wrapper after all -> parent is a node
+                        self._open_stream_node(nodes, edges, parent, references)
+
+                skip = has_ref or (parent is not None and parent.skip)
+                if skip:
+                    node_id = None
+                else:
+                    local = _localname(element.tag)
+                    tag_count[local] += 1
+                    node_id = f"{local}[{tag_count[local]}]"
+                element_ids.append(node_id)
+
+                frame = _StreamFrame(element, seq, node_id, skip)
+                if parent is None:
+                    self._open_stream_node(nodes, edges, frame, references)
+                stack.append(frame)
+                continue
+
+            # event == 'end'
+            if any(child.tag is etree.Entity for child in element):
+                # Unresolved entity references from an internal DTD
+                raise _StreamingUnsupported()
+            frame = stack.pop()
+            frame.text = element.text.strip() if element.text else ''
+            if stack and not stack[-1].skip:
+                parent = stack[-1]
+                if parent.node is None:
+                    parent.pending = frame
+                else:
+                    self._apply_stream_child(nodes, edges, parent, frame, references)
+
+            element.clear()
+            if stack:
+                # The root's previous siblings are prolog PIs with no parent
+                while element.getprevious() is not None:
+                    del element.getparent()[0]
+
+        connection_map: Dict[Node, List[Tuple[str, str]]] = {}
+        for source_node, relation_name, node_xpath in references:
+            targets = self._resolve_simple_path(node_xpath, root_tag, children_index)
+            if len(targets) != 1:
+                raise ValueError(
+                    f"Invalid reference '{node_xpath}' in XML: expected exactly 1 target, found {len(targets)}."
+                )
+            target_id = element_ids[targets[0]]
+            if target_id is None:
+                raise _StreamingUnsupported()
+            connection_map.setdefault(source_node, []).append((relation_name, target_id))
+
+        self._add_reference_edges(nodes, edges, connection_map)
+
+        graph.bulk_load(nodes, edges)
+        return graph
+
+    def _open_stream_node(self,
+                          nodes: List[Node],
+                          edges: List[Edge],
+                          frame: _StreamFrame,
+                          references: List[Tuple[Node, str, str]],
+                          ) -> None:
+        """Add the node for a streamed element and flush its pending first child."""
+        frame.node = self._add_element_node(nodes, frame.node_id, frame.label, frame.attrib.items())
+        if frame.pending is not None:
+            self._apply_stream_child(nodes, edges, frame, frame.pending, references)
+            frame.pending = None
+
+    def _apply_stream_child(self,
+                            nodes: List[Node],
+                            edges: List[Edge],
+                            parent: _StreamFrame,
+                            child: _StreamFrame,
+                            references: List[Tuple[Node, str, str]],
+                            ) -> None:
+        """Streaming counterpart of the per-child branches in ``_build_graph``."""
+        current_node = parent.node
+
+        if child.child_count == 1 and child.first_child_ref is not None:
+            references.append((current_node, child.label, child.first_child_ref))
+
+        elif child.child_count == 0 and len(child.attrib) == 0:
+            current_node.set_attribute(child.label, child.text)
+
+        elif child.child_count == 0:
+            self._add_leaf_node(nodes, edges, current_node, child.label, child.text, child.attrib)
+
+        elif child.skip:
+            # Element with a reference attribute and children; the DOM path
+            # reports this (it has no node id)
+            raise _StreamingUnsupported()
+
+        else:
+            self._add_child_edge(edges, current_node, child.node)
+
+    def _resolve_simple_path(self,
+                             xpath: str,
+                             root_tag: Optional[str],
+                             children_index: Dict[Tuple[int, str], List[int]],
+                             ) -> List[int]:
+        """
+        Evaluate an absolute path like ``/Graph/Person[2]`` against the
+        streaming index, returning the matching element sequence numbers.
+
+        :raises _StreamingUnsupported: For anything other than ``/name`` and
+            ``/name[n]`` steps.
+        """
+        if not xpath.startswith('/') or xpath.startswith('//'):
+            raise _StreamingUnsupported()
+
+        steps = []
+        for step in xpath[1:].split('/'):
+            match = _PATH_STEP.fullmatch(step)
+            if match is None:
+                raise _StreamingUnsupported()
+            position = match.group(2)
+            steps.append((match.group(1), int(position) if position else None))
+
+        name, position = steps[0]
+        current = [0] if name == root_tag and position in (None, 1) else []
+
+        for name, position in steps[1:]:
+            matched = []
+            for seq in current:
+                children = children_index.get((seq, name), [])
+                if position is None:
+                    matched.extend(children)
+                elif position <= len(children):
+                    matched.append(children[position - 1])
+            current = matched
+
+        return current
+
+    def _add_reference_edges(self,
+                             nodes: List[Node],
+                             edges: List[Edge],
+                             connection_map: Dict[Node, List[Tuple[str, str]]],
+                             ) -> None:
+        """
+        Add one edge per resolved reference.
+
+        Sources are stored as nodes when the reference is met; targets may
+        come later in the document, so they are resolved by id here, once
+        all nodes exist.
+        """
+        nodes_by_id = {node.node_id: node for node in nodes} if connection_map else {}
+        for source_node, connections in connection_map.items():
+            source_key = source_node.node_id
 
             for relation_name, target_id in connections:
-                target_node = graph.get_node(target_id)
+                target_node = nodes_by_id.get(target_id)
 
                 edge = Edge(edge_id=f'child:{source_key}->{target_id}',
                             source_node=source_node,
                             target_node=target_node,
                             label=relation_name)
 
-                graph.add_edge(edge)
+                edges.append(edge)
 
-        return graph
-    
     def _build_graph(self,
-                     graph: Graph,
-                     tree: etree._ElementTree,
+                     nodes: List[Node],
+                     edges: List[Edge],
                      root: etree._Element,
-                     id_map: Dict[str, str],
-                     connection_map: Dict[str, List[Tuple]],
+                     id_map: Dict[etree._Element, str],
+                     connection_map: Dict[Node, List[Tuple[str, str]]],
                      ref_attr: str = "reference",
                      ) -> Node:
-        current_id = id_map[tree.getpath(root)]
-        label = etree.QName(root.tag).localname
-        current_node = XMLNode(current_id, label=label)
-
-        graph.add_node(current_node)
-
-        for attr_name, attr_value in root.attrib.items():
-            # attr_node = XMLNode(node_id=f'{current_id}:{attr_name}', value=attr_value)
-            # graph.add_node(attr_node)
-            # attr_edge = Edge(source_node=current_node,
-            #                  target_node=attr_node,
-            #                  edge_id=f'attr:{current_id}->{attr_name}',
-            #                  EdgeDirection = EdgeDirection.DIRECTED,
-            #                  attr=attr_name)
-            # graph.add_edge(attr_edge)
-            current_node.set_attribute(attr_name, attr_value)
-
-        for child in root:
+        """
+        Collect nodes and edges for ``root`` and its descendants.
+
+        Walks the tree depth-first with an explicit stack, so deep documents
+        do not hit the recursion limit. Nodes and edges are added in the same
+        order as a recursive walk: an element's ``Child`` edge is added after
+        its whole subtree.
+        """
+        root_node = self._add_dom_node(nodes, root, id_map)
+        # Each frame: (element node, iterator over remaining children)
+        stack = [(root_node, iter(root))]
+
+        while stack:
+            current_node, children = stack[-1]
+
+            child = next(children, None)
+            if child is None:
+                stack.pop()
+                if stack:
+                    self._add_child_edge(edges, stack[-1][0], current_node)
+                continue
+
             # Handle cyclic edges
             # Child is wrapper for reference
             if len(child) == 1 and ref_attr in child[0].attrib:
-                relation_name = etree.QName(child.tag).localname
+                relation_name = _localname(child.tag)
 
                 node_xpath = child[0].attrib[ref_attr]
-                targets = tree.getroot().xpath(node_xpath)
+                targets = _compile_xpath(node_xpath)(root)
 
                 if len(targets) != 1:
                     raise ValueError(
                         f"Invalid reference '{node_xpath}' in XML: expected exactly 1 target, found {len(targets)}."
                     )
-                
-                target = targets[0]
-                target_id = id_map[tree.getpath(target)]
-                connection_map.setdefault(current_id, []).append((relation_name, target_id))
+
+                target_id = id_map[targets[0]]
+                connection_map.setdefault(current_node, []).append((relation_name, target_id))
 
             # Leaf node with no attributes -> same as attribute
             elif len(child) == 0 and len(child.attrib)==0:
-                attribute_name = etree.QName(child.tag).localname
+                attribute_name = _localname(child.tag)
 
                 leaf_text = child.text.strip() if child.text else ''
-                # attr_node = XMLNode(node_id=f'{current_id}:{attribute_name}', value=leaf_text)
-                # graph.add_node(attr_node)
-
-                # # If the edge has any attributes just add them directly
-                # edge_attributes = dict(child.attrib)
-
-                # attr_edge = Edge(edge_id=f'attr:{current_id}->{attribute_name}',
-                #                     source_node=current_node,
-                #                     target_node=attr_node,
-                #                     EdgeDirection=EdgeDirection.DIRECTED,
-                #                     label=attribute_name,
-                #                     **edge_attributes)
-
-                # graph.add_edge(attr_edge)
                 current_node.set_attribute(attribute_name, leaf_text)
 
             # Leaf node with attributes -> new node
             elif len(child) == 0:
-                attribute_name = etree.QName(child.tag).localname
+                attribute_name = _localname(child.tag)
 
                 leaf_text = child.text.strip() if child.text else ''
-                additional_attributes = dict(child.attrib)
-
-                attr_node = XMLNode(node_id=f'{current_id}:{attribute_name}', value=leaf_text, **additional_attributes)
-                graph.add_node(attr_node)
-
-                attr_edge = Edge(edge_id=f'attr:{current_id}->{attribute_name}',
-                                    source_node=current_node,
-                                    target_node=attr_node,
-                                    EdgeDirection=EdgeDirection.DIRECTED,
-                                    label=attribute_name)
-
-                graph.add_edge(attr_edge)
-
+                self._add_leaf_node(nodes, edges, current_node, attribute_name, leaf_text, dict(child.attrib))
 
             # Has grandchildren -> new child object
             else:
-                child_node = self._build_graph(graph, tree, child, id_map, connection_map, ref_attr)
-
-                child_xpath = tree.getpath(child)
-                child_id = id_map.get(child_xpath)
-                edge_id = f"child:{current_id}->{child_id}"
-
-                graph.add_edge(Edge(edge_id=edge_id,
-                                    source_node=current_node,
-                                    target_node=child_node,
-                                    EdgeDirection=EdgeDirection.DIRECTED,
-                                    label="Child"))
+                child_node = self._add_dom_node(nodes, child, id_map)
+                stack.append((child_node, iter(child)))
+
+        return root_node
+
+    def _add_dom_node(self,
+                      nodes: List[Node],
+                      element: etree._Element,
+                      id_map: Dict[etree._Element, str],
+                      ) -> Node:
+        label = _localname(element.tag)
+        return self._add_element_node(nodes, id_map[element], label, element.attrib.items())
+
+    def _add_element_node(self, nodes: List[Node], node_id: str, label: str, attributes) -> Node:
+        """Create the node for an element, with its XML attributes, and collect it."""
+        node = XMLNode(node_id, label=label)
+        nodes.append(node)
+
+        for attr_name, attr_value in attributes:
+            node.set_attribute(attr_name, attr_value)
+
+        return node
+
+    def _add_leaf_node(self,
+                       nodes: List[Node],
+                       edges: List[Edge],
+                       current_node: Node,
+                       attribute_name: str,
+                       leaf_text: str,
+                       additional_attributes: Dict[str, Any],
+                       ) -> None:
+        """Leaf element with attributes -> its own node linked from the parent."""
+        current_id = current_node.node_id
+
+        attr_node = XMLNode(node_id=f'{current_id}:{attribute_name}', value=leaf_text, **additional_attributes)
+        nodes.append(attr_node)
+
+        attr_edge = Edge(edge_id=f'attr:{current_id}->{attribute_name}',
+                            source_node=current_node,
+                            target_node=attr_node,
+                            EdgeDirection=EdgeDirection.DIRECTED,
+                            label=attribute_name)
+
+        edges.append(attr_edge)
+
+    def _add_child_edge(self, edges: List[Edge], parent_node: Node, child_node: Node) -> None:
+        edges.append(Edge(edge_id=f"child:{parent_node.node_id}->{child_node.node_id}",
+                            source_node=parent_node,
+                            target_node=child_node,
+                            EdgeDirection=EdgeDirection.DIRECTED,
+                            label="Child"))
 
-        return current_node
-    
     def _assign_node_ids(self,
-                        tree: etree._ElementTree,
-                        root: etree._Element,
-                        id_map: Dict[str, str],
-                        tag_count: Dict[str, int],
-                        ref_attr: str = "reference",
-                        ) -> Dict[str, str]:
+                         root: etree._Element,
+                         ref_attr: str = "reference",
+                         ) -> Dict[etree._Element, str]:
         """
-        Creates a map which maps absolute xpaths into human readable unique ids.
-        """
-        if ref_attr in root.attrib:
-            return id_map
+        Map every element to a human readable unique id, in document order.
 
-        local = etree.QName(root.tag).localname
+        Elements carrying ``ref_attr`` (and their subtrees) get no id. The map
+        is keyed by the elements themselves, which keeps their lxml proxies
+        alive so later lookups hit the same objects.
+        """
+        id_map: Dict[etree._Element, str] = {}
+        tag_count: Dict[str, int] = defaultdict(int)
+        stack = [root]
 
-        tag_count[local] = tag_count.get(local, 0) + 1
+        while stack:
+            element = stack.pop()
+            if ref_attr in element.attrib:
+                continue
 
-        # i.e. Person[1], Person[2]
-        generated_id = f"{local}[{tag_count[local]}]"
+            local = _localname(element.tag)
+            tag_count[local] += 1
 
-        id_map[tree.getpath(root)] = generated_id
+            # i.e. Person[1], Person[2]
+            id_map[element] = f"{local}[{tag_count[local]}]"
 
-        for child in root:
-            self._assign_node_ids(tree, child, id_map, tag_count, ref_attr)
+            stack.extend(reversed(element))
 
         return id_map
 
@@ -213,4 +526,4 @@ if __name__ == '__main__':
     for edge in edges:
         print(edge.edge_id)
         print(edge.get_all_attributes())
-        print("----")
\ No newline at end of file
+        print("----")
@@ -2,6 +2,8 @@
 """
 Comprehensive CLI tests — commands, command processor, parsing, undo, edge cases.
 """
+import shlex
+
 import pytest
 from copy import deepcopy
 
@@ -27,14 +29,14 @@ from graph_platform.cli.commands import (
     HelpCommand,
     ListCommand,
 )
-from graph_platform.cli.command_processor import CommandProcessor
+from graph_platform.cli.command_processor import CommandProcessor, _tokenize
 
 
 # ── Helpers ──────────────────────────────────────────────────────
 
 class _TestNode(Node):
     """Concrete Node for test use."""
-    pass
+    __slots__ = ()
 
 
 def _empty_graph(graph_id: str = "test") -> Graph:
@@ -52,6 +54,18 @@ def _small_graph() -> Graph:
     return g
 
 
+@pytest.fixture(scope="module")
+def small_graph_template() -> Graph:
+    """Shared ``_small_graph()`` for tests that only read it."""
+    return _small_graph()
+
+
+@pytest.fixture
+def small_graph(small_graph_template) -> Graph:
+    """Private copy of the small graph for tests that mutate it."""
+    return deepcopy(small_graph_template)
+
+
 # ═════════════════════════════════════════════════════════════════
 #  CommandResult
 # ═════════════════════════════════════════════════════════════════
@@ -139,8 +153,8 @@ class TestDeleteNodeCommand:
         r = DeleteNodeCommand("x").execute(g)
         assert r.success is False
 
-    def test_delete_node_with_edges_fails(self):
-        g = _small_graph()
+    def test_delete_node_with_edges_fails(self, small_graph):
+        g = small_graph
         r = DeleteNodeCommand("A").execute(g)
         assert r.success is False
         assert "connected edge" in r.message
@@ -188,8 +202,8 @@ class TestCreateEdgeCommand:
         assert r.success is False
         assert "Target" in r.message
 
-    def test_create_edge_duplicate_fails(self):
-        g = _small_graph()
+    def test_create_edge_duplicate_fails(self, small_graph):
+        g = small_graph
         r = CreateEdgeCommand("e1", "A", "B").execute(g)
         assert r.success is False
         assert "already exists" in r.message
@@ -200,8 +214,8 @@ class TestCreateEdgeCommand:
 
 class TestEditEdgeCommand:
 
-    def test_edit_existing_edge(self):
-        g = _small_graph()
+    def test_edit_existing_edge(self, small_graph):
+        g = small_graph
         cmd = EditEdgeCommand("e1", {"Relation": "enemy"})
         r = cmd.execute(g)
         assert r.success is True
@@ -218,8 +232,8 @@ class TestEditEdgeCommand:
 
 class TestDeleteEdgeCommand:
 
-    def test_delete_edge(self):
-        g = _small_graph()
+    def test_delete_edge(self, small_graph):
+        g = small_graph
         r = DeleteEdgeCommand("e1").execute(g)
         assert r.success is True
         assert g.get_edge("e1") is None
@@ -280,8 +294,8 @@ class TestSearchCommand:
 
 class TestClearCommand:
 
-    def test_clear_empties_graph(self):
-        g = _small_graph()
+    def test_clear_empties_graph(self, small_graph):
+        g = small_graph
         cmd = ClearCommand()
         r = cmd.execute(g)
         assert r.success is True
@@ -296,6 +310,16 @@ class TestClearCommand:
     def test_clear_supports_undo(self):
         assert ClearCommand().supports_undo is True
 
+    def test_clear_undo_restores(self, small_graph):
+        g = small_graph
+        cmd = ClearCommand()
+        cmd.execute(g)
+        r = cmd.undo(g)
+        assert r.success is True
+        assert g.get_number_of_nodes() == 3
+        assert g.get_number_of_edges() == 2
+        assert g.get_neighbors(g.get_node("B")) != []
+
 
 class TestUndoCommand:
 
@@ -307,6 +331,12 @@ class TestUndoCommand:
     def test_undo_does_not_support_undo(self):
         assert UndoCommand().supports_undo is False
 
+    def test_base_undo_reports_failure(self):
+        g = _empty_graph()
+        r = HelpCommand().undo(g)
+        assert r.success is False
+        assert "cannot be undone" in r.message
+
 
 class TestResetCommand:
 
@@ -325,42 +355,42 @@ class TestResetCommand:
 
 class TestInfoCommand:
 
-    def test_info_graph_summary(self):
-        g = _small_graph()
+    def test_info_graph_summary(self, small_graph_template):
+        g = small_graph_template
         r = InfoCommand().execute(g)
         assert r.success is True
         assert "3 node(s)" in r.message
         assert "2 edge(s)" in r.message
 
-    def test_info_node(self):
-        g = _small_graph()
+    def test_info_node(self, small_graph_template):
+        g = small_graph_template
         r = InfoCommand("node", "A").execute(g)
         assert r.success is True
         assert "Alice" in r.message
 
-    def test_info_node_not_found(self):
-        g = _small_graph()
+    def test_info_node_not_found(self, small_graph_template):
+        g = small_graph_template
         r = InfoCommand("node", "ZZZ").execute(g)
         assert r.success is False
 
-    def test_info_edge(self):
-        g = _small_graph()
+    def test_info_edge(self, small_graph_template):
+        g = small_graph_template
         r = InfoCommand("edge", "e1").execute(g)
         assert r.success is True
         assert "A" in r.message and "B" in r.message
 
-    def test_info_edge_not_found(self):
-        g = _small_graph()
+    def test_info_edge_not_found(self, small_graph_template):
+        g = small_graph_template
         r = InfoCommand("edge", "ZZZ").execute(g)
         assert r.success is False
 
-    def test_info_edge_shows_direction_arrow(self):
-        g = _small_graph()
+    def test_info_edge_shows_direction_arrow(self, small_graph_template):
+        g = small_graph_template
         r = InfoCommand("edge", "e1").execute(g)
         assert "->" in r.message  # e1 is directed
 
-    def test_info_edge_undirected(self):
-        g = _small_graph()
+    def test_info_edge_undirected(self, small_graph_template):
+        g = small_graph_template
         r = InfoCommand("edge", "e2").execute(g)
         assert "--" in r.message  # e2 is undirected
 
@@ -379,21 +409,21 @@ class TestInfoCommand:
 
 class TestListCommand:
 
-    def test_list_both(self):
-        g = _small_graph()
+    def test_list_both(self, small_graph_template):
+        g = small_graph_template
         r = ListCommand().execute(g)
         assert r.success is True
         assert "Nodes (3)" in r.message
         assert "Edges (2)" in r.message
 
-    def test_list_nodes_only(self):
-        g = _small_graph()
+    def test_list_nodes_only(self, small_graph_template):
+        g = small_graph_template
         r = ListCommand("nodes").execute(g)
         assert "Nodes" in r.message
         assert "Edges" not in r.message
 
-    def test_list_edges_only(self):
-        g = _small_graph()
+    def test_list_edges_only(self, small_graph_template):
+        g = small_graph_template
         r = ListCommand("edges").execute(g)
         assert "Edges" in r.message
         assert "Nodes" not in r.message
@@ -431,8 +461,8 @@ class TestProcessorParsing:
         return CommandProcessor()
 
     @pytest.fixture
-    def graph(self):
-        return _small_graph()
+    def graph(self, small_graph):
+        return small_graph
 
     # ── Empty / whitespace ────────────────────────────────────────
 
@@ -445,6 +475,31 @@ class TestProcessorParsing:
         r = proc.process("   ", graph)
         assert r.success is False
 
+    # ── Tokenizer ─────────────────────────────────────────────────
+
+    @pytest.mark.parametrize("text", [
+        "create node --id=X --property Name='Alice Smith'",
+        'filter "Age >= 30"',
+        "search 'Name=Tom' extra",
+        "edit node --id X --property=City=\"New York\"",
+        "a''b 'c'\"d\"e",
+        "escaped\\ space",
+        "create   node\t--id=1",
+        "''",
+    ])
+    def test_tokenize_matches_shlex(self, text):
+        assert _tokenize(text) == tuple(shlex.split(text))
+
+    def test_tokenize_unbalanced_quote_splits_on_whitespace(self):
+        assert _tokenize("filter 'Age >= 30") == ("filter", "'Age", ">=", "30")
+
+    def test_repeated_line_parses_to_fresh_command(self, proc, graph):
+        proc.process("create node --id=Z", graph)
+        r = proc.process("create node --id=Z", graph)
+        assert r.success is False
+        proc.process("delete node --id=Z", graph)
+        assert proc.process("create node --id=Z", graph).success is True
+
     # ── Unknown command ───────────────────────────────────────────
 
     def test_unknown_command(self, proc, graph):
@@ -667,6 +722,35 @@ class TestProcessorParsing:
         assert r.success is False
         assert "Key=Value" in r.message
 
+    def test_property_before_id(self, proc, graph):
+        r = proc.process("create node --property Color=red --id P3 --property Size=2", graph)
+        assert r.success is True
+        node = graph.get_node("P3")
+        assert node.get_attribute("Color") == "red"
+        assert node.get_attribute("Size") == 2
+
+    def test_missing_id_reported_before_bad_property(self, proc, graph):
+        r = proc.process("create node --property NoEquals", graph)
+        assert r.success is False
+        assert "--id" in r.message
+
+    def test_bare_property_does_not_swallow_id(self, proc, graph):
+        r = proc.process("create node --property --id=n1", graph)
+        assert r.success is True
+        assert graph.get_node("n1") is not None
+
+    def test_bare_property_takes_token_after_id(self, proc, graph):
+        r = proc.process("edit node --property --id=A Age=1", graph)
+        assert r.success is True
+        assert graph.get_node("A").get_attribute("Age") == 1
+
+    def test_delete_ignores_properties(self, proc):
+        g = _empty_graph()
+        proc.process("create node --id=n1", g)
+        r = proc.process("delete node --id=n1 --property=bad", g)
+        assert r.success is True
+        assert g.get_node("n1") is None
+
 
 # ═════════════════════════════════════════════════════════════════
 #  COMMAND PROCESSOR — undo stack
@@ -687,6 +771,14 @@ class TestProcessorUndo:
         assert r.graph.get_node("X") is None
         assert proc.get_undo_depth() == 0
 
+    def test_undo_of_command_without_inverse_fails(self):
+        proc = CommandProcessor()
+        g = _empty_graph()
+        proc._undo_stack.append(HelpCommand())
+        r = proc.process("undo", g)
+        assert r.success is False
+        assert proc.get_undo_depth() == 0
+
     def test_undo_multiple(self):
         proc = CommandProcessor()
         g = _empty_graph()
@@ -713,45 +805,106 @@ class TestProcessorUndo:
             proc.process(f"create node --id=n{i}", g)
         assert proc.get_undo_depth() == 50
 
-    def test_undo_after_clear(self):
+    def test_undo_stack_custom_limit(self):
+        proc = CommandProcessor(max_undo=3)
+        g = _empty_graph()
+        for i in range(5):
+            proc.process(f"create node --id=n{i}", g)
+        assert proc.get_undo_depth() == 3
+        proc.process("undo", g)
+        assert g.get_node("n4") is None
+        assert g.get_node("n1") is not None
+
+    def test_undo_disabled(self):
+        proc = CommandProcessor(max_undo=0)
+        g = _empty_graph()
+        proc.process("create node --id=n1", g)
+        assert proc.get_undo_depth() == 0
+        assert proc.process("undo", g).success is False
+
+    def test_negative_undo_limit_rejected(self):
+        with pytest.raises(ValueError):
+            CommandProcessor(max_undo=-1)
+
+    def test_undo_after_clear(self, small_graph):
         proc = CommandProcessor()
-        g = _small_graph()
+        g = small_graph
         proc.process("clear", g)
         assert g.get_number_of_nodes() == 0
         r = proc.process("undo", g)
         assert r.success is True
         assert r.graph.get_number_of_nodes() == 3
 
-    def test_undo_after_filter(self):
+    def test_undo_after_filter(self, small_graph):
         proc = CommandProcessor()
-        g = _small_graph()
+        g = small_graph
         proc.process("filter Age >= 30", g)
         assert proc.get_undo_depth() == 1
         r = proc.process("undo", g)
         assert r.success is True
         assert r.graph.get_number_of_nodes() == 3
 
-    def test_undo_after_search(self):
+    def test_undo_after_search(self, small_graph):
         proc = CommandProcessor()
-        g = _small_graph()
+        g = small_graph
         proc.process("search Name=Alice", g)
         assert proc.get_undo_depth() == 1
 
+    def test_undo_edit_node_restores_attributes(self, small_graph):
+        proc = CommandProcessor()
+        g = small_graph
+        proc.process("edit node --id=A --property Age=41 --property City=Paris", g)
+        r = proc.process("undo", g)
+        assert r.success is True
+        node = r.graph.get_node("A")
+        assert node.get_attribute("Age") == 30
+        assert "City" not in node.attributes
+        assert "City" not in node.attribute_types
+
+    def test_undo_edit_edge_restores_value_and_type(self, small_graph):
+        proc = CommandProcessor()
+        g = small_graph
+        proc.process("edit edge --id=e1 --property Relation=42", g)
+        assert g.get_edge("e1").get_attribute("Relation") == 42
+        proc.process("undo", g)
+        edge = g.get_edge("e1")
+        assert edge.get_attribute("Relation") == "friend"
+        assert edge.attribute_types["Relation"].value == "str"
+
+    def test_undo_delete_edge_restores_edge(self, small_graph):
+        proc = CommandProcessor()
+        g = small_graph
+        proc.process("delete edge --id=e1", g)
+        r = proc.process("undo", g)
+        assert r.graph.get_edge("e1") is not None
+        assert r.graph.get_edge("e1") in r.graph.get_outgoing_edges(r.graph.get_node("A"))
+
+    def test_undo_filter_then_mutation(self, small_graph):
+        proc = CommandProcessor()
+        g = small_graph
+        filtered = proc.process("filter Age >= 30", g).graph
+        proc.process("create node --id=Z", filtered)
+        r = proc.process("undo", filtered)
+        assert r.graph is filtered
+        assert r.graph.get_node("Z") is None
+        r = proc.process("undo", r.graph)
+        assert r.graph is g
+
     def test_help_does_not_push_undo(self):
         proc = CommandProcessor()
         g = _empty_graph()
         proc.process("help", g)
         assert proc.get_undo_depth() == 0
 
-    def test_info_does_not_push_undo(self):
+    def test_info_does_not_push_undo(self, small_graph):
         proc = CommandProcessor()
-        g = _small_graph()
+        g = small_graph
         proc.process("info", g)
         assert proc.get_undo_depth() == 0
 
-    def test_list_does_not_push_undo(self):
+    def test_list_does_not_push_undo(self, small_graph):
         proc = CommandProcessor()
-        g = _small_graph()
+        g = small_graph
         proc.process("list", g)
         assert proc.get_undo_depth() == 0
 
@@ -767,6 +920,16 @@ class TestProcessorUndo:
         proc.process("reset", g)
         assert proc.get_undo_depth() == 0
 
+    def test_workspace_history_only_for_successful_mutations(self):
+        from graph_platform.workspace import Workspace
+        proc = CommandProcessor()
+        ws = Workspace(_small_graph())
+        for text in ("help", "info", "list", "delete node --id=nonexistent"):
+            proc.process(text, ws.current_graph, workspace=ws)
+        assert ws.history_depth == 0
+        proc.process("create node --id=Z", ws.current_graph, workspace=ws)
+        assert ws.history_depth == 1
+
 
 # ═════════════════════════════════════════════════════════════════
 #  EDGE CASES & INTEGRATION
@@ -797,9 +960,9 @@ class TestEdgeCases:
         assert node.get_attribute("Name") == "Alice"
         assert node.get_attribute("City") == "Paris"
 
-    def test_quoted_filter_with_spaces(self):
+    def test_quoted_filter_with_spaces(self, small_graph):
         proc = CommandProcessor()
-        g = _small_graph()
+        g = small_graph
         r = proc.process("filter 'Age >= 30'", g)
         assert r.success is True
 
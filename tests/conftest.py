@@ -5,6 +5,7 @@ Stub graph: social network with 15 nodes and 25 edges.
 Mixed attribute types, all undirected edges, contains a cycle.
 """
 import pytest
+from copy import deepcopy
 from datetime import date
 from api.models.graph import Graph
 from api.models.edge import Edge, EdgeDirection
@@ -13,7 +14,7 @@ from api.models.node import Node
 
 class ConcreteNode(Node):
     """Minimal concrete Node for testing purposes."""
-    pass
+    __slots__ = ()
 
 
 # ── Node definitions ─────────────────────────────────────────────
@@ -68,39 +69,40 @@ _EDGES = [
 
 def _build_graph(graph_id: str = "stub_social") -> Graph:
     g = Graph(graph_id)
-
-    for node_id, attrs in _NODES:
-        g.add_node(ConcreteNode(node_id, **attrs))
-
-    for edge_id, src, tgt, attrs in _EDGES:
-        g.add_edge(Edge(
-            edge_id,
-            g.get_node(src),
-            g.get_node(tgt),
-            EdgeDirection.UNDIRECTED,
-            **attrs
-        ))
+    nodes = {node_id: ConcreteNode(node_id, **attrs) for node_id, attrs in _NODES}
+    g.bulk_load(
+        nodes.values(),
+        [Edge(edge_id, nodes[src], nodes[tgt], EdgeDirection.UNDIRECTED, **attrs)
+         for edge_id, src, tgt, attrs in _EDGES],
+    )
 
     return g
 
 
 # ── Pytest fixtures ──────────────────────────────────────────────
 
+@pytest.fixture(scope="session")
+def stub_graph_template() -> Graph:
+    """Stub graph built once per session; never mutate it — use ``stub_graph``."""
+    return _build_graph()
+
+
 @pytest.fixture
-def stub_graph() -> Graph:
+def stub_graph(stub_graph_template) -> Graph:
     """Full stub graph: 15 nodes, 25 undirected edges, contains a cycle."""
-    return _build_graph()
+    return deepcopy(stub_graph_template)
 
 
 @pytest.fixture
-def stub_graph_copy() -> Graph:
-    """Freshly built each time — use when a test mutates the graph."""
-    return _build_graph()
+def stub_graph_copy(stub_graph_template) -> Graph:
+    """Independent copy each time — use when a test mutates the graph."""
+    return deepcopy(stub_graph_template)
 
 
 @pytest.fixture
-def acyclic_graph() -> Graph:
+def acyclic_graph(stub_graph_template) -> Graph:
     """Same graph without e25 (n15—n1) — acyclic version for cycle detection tests."""
-    g = _build_graph("stub_acyclic")
+    g = deepcopy(stub_graph_template)
+    g.graph_id = "stub_acyclic"
     g.remove_edge("e25")
     return g
@@ -7,10 +7,11 @@ from api.models.node import Node
 
 class ConcreteNode(Node):
     """Minimal concrete Node for testing purposes."""
-    pass
+    __slots__ = ()
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def service():
+    """FilterService keeps no per-instance state; one instance serves the module."""
     return FilterService()
 
 
@@ -48,6 +49,8 @@ class TestParser:
         "== 30",
         ">= 30",
         "Age =! 30",
+        "Age >=   ",
+        "Age " + " " * 10000 + "x",
     ])
     def test_parser_invalid_syntax_raises_error(self, service, stub_graph, query):
         """Malformed expressions must raise FilterParseError."""
@@ -126,6 +129,22 @@ class TestSuccessiveApplication:
         result_ids = set(g3.nodes.keys())
         assert result_ids == {"n3", "n9", "n14"}
 
+    def test_filter_all_matches_successive_filters(self, service, stub_graph):
+        chained = service.filter(service.filter(stub_graph, "City == Paris"), "Age > 30")
+        combined = service.filter_all(stub_graph, ["City == Paris", "Age > 30"])
+        assert set(combined.nodes.keys()) == set(chained.nodes.keys())
+        assert set(combined.edges.keys()) == set(chained.edges.keys())
+
+    def test_filter_all_later_query_only_sees_survivors(self, service, stub_graph):
+        """A type error on a node already filtered out is never raised."""
+        stub_graph.get_node("n4").set_attribute("Flag", True)  # n4 is in Berlin
+        result = service.filter_all(stub_graph, ["City == Paris", "Flag > true"])
+        assert len(result.nodes) == 0
+
+    def test_filter_all_rejects_invalid_query(self, service, stub_graph):
+        with pytest.raises(FilterParseError):
+            service.filter_all(stub_graph, ["City == Paris", "Age >>"])
+
     def test_search_then_filter(self, service, stub_graph):
         """SearchService produces a subgraph; FilterService must accept it."""
         from services.search_service import SearchService
@@ -178,4 +197,22 @@ class TestDateAndAdvanced:
 
         # Only n1 has Hobby=="chess"
         assert set(result.nodes.keys()) == {"n1"}
-        # No crash — 13 other nodes simply lacked the attribute
\ No newline at end of file
+        # No crash — 13 other nodes simply lacked the attribute
+
+    def test_filter_mixed_attribute_types(self, service, stub_graph):
+        """Each attribute type converts the target on its own terms."""
+        stub_graph.get_node("n1").set_attribute("Code", "42")
+        stub_graph.get_node("n2").set_attribute("Code", "abc")
+
+        result = service.filter(stub_graph, "Code == 42")
+        assert set(result.nodes.keys()) == {"n1"}
+
+    def test_filter_bool_ordering_raises_error(self, service, stub_graph):
+        stub_graph.get_node("n1").set_attribute("Active", True)
+        with pytest.raises(FilterTypeError):
+            service.filter(stub_graph, "Active > true")
+
+    def test_repeated_filter_gives_same_result(self, service, stub_graph):
+        first = service.filter(stub_graph, "Age >= 35")
+        second = service.filter(stub_graph, "Age >= 35")
+        assert set(first.nodes.keys()) == set(second.nodes.keys())
@@ -5,6 +5,7 @@ Tests for the Graph model (api/api/models/graph.py).
 Covers:
     • Node CRUD (add, get, remove, duplicate ID error)
     • Edge CRUD (add, get, remove, validation errors)
+    • Bulk node / edge insertion
     • Adjacency / neighbor queries
     • Cycle detection (directed, undirected, acyclic)
     • Subgraph extraction (deep-copy isolation)
@@ -24,7 +25,7 @@ from api.models.edge import Edge, EdgeDirection
 
 class ConcreteNode(Node):
     """Minimal concrete Node for testing purposes."""
-    pass
+    __slots__ = ()
 
 # ═════════════════════════════════════════════════════════════════
 #  FIXTURES
@@ -36,10 +37,10 @@ def empty_graph() -> Graph:
     return Graph("empty")
 
 
-@pytest.fixture
-def small_graph() -> Graph:
+@pytest.fixture(scope="module")
+def small_graph_template() -> Graph:
     """
-    Small 4-node graph for targeted tests:
+    Small 4-node graph for targeted tests, shared by tests that only read it:
 
         A --e1--> B --e2--> C --e3--> D
     """
@@ -57,6 +58,12 @@ def small_graph() -> Graph:
     return g
 
 
+@pytest.fixture
+def small_graph(small_graph_template) -> Graph:
+    """Private copy of the small graph for tests that mutate it."""
+    return deepcopy(small_graph_template)
+
+
 # ═════════════════════════════════════════════════════════════════
 #  NODE CRUD
 # ═════════════════════════════════════════════════════════════════
@@ -77,6 +84,12 @@ class TestNodeCRUD:
     def test_get_node_returns_none_for_missing(self, empty_graph):
         assert empty_graph.get_node("nonexistent") is None
 
+    def test_contains_node_and_edge(self, small_graph):
+        assert small_graph.contains_node("A")
+        assert not small_graph.contains_node("nonexistent")
+        assert small_graph.contains_edge("e1")
+        assert not small_graph.contains_edge("nonexistent")
+
     def test_get_all_nodes(self, small_graph):
         nodes = small_graph.get_all_nodes()
         assert len(nodes) == 4
@@ -103,6 +116,20 @@ class TestNodeCRUD:
         # e3 (C→D) should survive
         assert small_graph.get_edge("e3") is not None
 
+    def test_node_from_attributes_matches_kwargs(self):
+        attrs = {"Name": "Alice", "Age": "30", "Born": date(1994, 3, 12)}
+        a = ConcreteNode.from_attributes("A", attrs)
+        b = ConcreteNode("A", **attrs)
+        assert isinstance(a, ConcreteNode)
+        assert a.attributes == b.attributes
+        assert a.attribute_types == b.attribute_types
+
+    def test_edge_from_attributes_matches_kwargs(self, small_graph):
+        a, b = small_graph.get_node("A"), small_graph.get_node("B")
+        e = Edge.from_attributes("ex", a, b, EdgeDirection.UNDIRECTED, {"Weight": "1.5"})
+        assert e.direction == EdgeDirection.UNDIRECTED
+        assert e.get_attribute("Weight") == 1.5
+
 
 # ═════════════════════════════════════════════════════════════════
 #  EDGE CRUD
@@ -160,28 +187,69 @@ class TestEdgeCRUD:
         assert "e2" in b_edges
 
 
+# ═════════════════════════════════════════════════════════════════
+#  BULK INSERTION
+# ═════════════════════════════════════════════════════════════════
+
+class TestBulkInsert:
+
+    def test_bulk_insert_matches_single_inserts(self, small_graph):
+        g = Graph("bulk")
+        g.add_nodes_bulk(deepcopy(small_graph.get_all_nodes()))
+        nodes = g.nodes
+        g.add_edges_bulk(
+            Edge(e.edge_id, nodes[e.source_node.node_id], nodes[e.target_node.node_id],
+                 e.direction, **e.attributes)
+            for e in small_graph.get_all_edges()
+        )
+        assert list(g.nodes) == list(small_graph.nodes)
+        assert list(g.edges) == list(small_graph.edges)
+        assert [e.edge_id for e in g._adjacency_list["B"]] == ["e1", "e2"]
+
+    def test_bulk_duplicate_node_adds_nothing(self, empty_graph):
+        with pytest.raises(ValueError):
+            empty_graph.add_nodes_bulk([ConcreteNode("X"), ConcreteNode("X")])
+        assert empty_graph.get_number_of_nodes() == 0
+
+    def test_bulk_edge_to_missing_node_adds_nothing(self, small_graph):
+        a = small_graph.get_node("A")
+        ghost = ConcreteNode("GHOST")
+        with pytest.raises(ValueError):
+            small_graph.add_edges_bulk([Edge("e9", a, a), Edge("e10", a, ghost)])
+        assert small_graph.get_edge("e9") is None
+        assert small_graph.get_number_of_edges() == 3
+
+    def test_bulk_load_rejected_edge_leaves_graph_unchanged(self, small_graph):
+        new = ConcreteNode("X")
+        ghost = ConcreteNode("GHOST")
+        with pytest.raises(ValueError):
+            small_graph.bulk_load([new], [Edge("e9", new, ghost)])
+        assert small_graph.get_node("X") is None
+        assert "X" not in small_graph._adjacency_list
+        assert small_graph.get_number_of_edges() == 3
+
 # ═════════════════════════════════════════════════════════════════
 #  NEIGHBOR / ADJACENCY QUERIES
 # ═════════════════════════════════════════════════════════════════
 
 class TestNeighborQueries:
 
-    def test_get_neighbors_directed(self, small_graph):
+    def test_get_neighbors_directed(self, small_graph_template):
         """A→B: B is neighbor of A."""
-        a = small_graph.get_node("A")
-        neighbors = small_graph.get_neighbors(a)
+        a = small_graph_template.get_node("A")
+        neighbors = small_graph_template.get_neighbors(a)
         neighbor_ids = {n.node_id for n in neighbors}
         assert "B" in neighbor_ids
 
-    def test_get_outgoing_edges(self, small_graph):
-        b = small_graph.get_node("B")
-        out = small_graph.get_outgoing_edges(b)
+    def test_get_outgoing_edges(self, small_graph_template):
+        b = small_graph_template.get_node("B")
+        out = small_graph_template.get_outgoing_edges(b)
         assert len(out) == 1
         assert out[0].edge_id == "e2"
 
-    def test_get_incoming_edges(self, small_graph):
-        b = small_graph.get_node("B")
-        inc = small_graph.get_incoming_edges(b)
+    def test_get_incoming_edges(self, small_graph_template):
+        b = small_graph_template.get_node("B")
+        inc = small_graph_template.get_incoming_edges(b)
         assert len(inc) == 1
         assert inc[0].edge_id == "e1"
 
@@ -264,6 +332,33 @@ class TestCycleDetection:
         g.add_edge(Edge("e2", b, c, EdgeDirection.UNDIRECTED))
         assert g.has_cycle() is False
 
+    def test_undirected_parallel_edges_are_not_a_cycle(self):
+        """Two undirected edges between the same pair do not form a cycle."""
+        g = Graph("parallel")
+        a, b = ConcreteNode("A"), ConcreteNode("B")
+        g.add_node(a)
+        g.add_node(b)
+        g.add_edge(Edge("e1", a, b, EdgeDirection.UNDIRECTED))
+        g.add_edge(Edge("e2", b, a, EdgeDirection.UNDIRECTED))
+        assert g.has_cycle() is False
+
+    def test_undirected_self_loop_is_a_cycle(self):
+        g = Graph("loop")
+        a = ConcreteNode("A")
+        g.add_node(a)
+        g.add_edge(Edge("e1", a, a, EdgeDirection.UNDIRECTED))
+        assert g.has_cycle() is True
+
+    def test_long_directed_chain_does_not_recurse(self):
+        """A chain longer than the recursion limit is walked iteratively."""
+        g = Graph("chain")
+        nodes = [ConcreteNode(f"n{i}") for i in range(5000)]
+        g.bulk_load(nodes, [Edge(f"e{i}", nodes[i], nodes[i + 1], EdgeDirection.DIRECTED)
+                            for i in range(len(nodes) - 1)])
+        assert g.has_cycle() is False
+        g.add_edge(Edge("back", nodes[-1], nodes[0], EdgeDirection.DIRECTED))
+        assert g.has_cycle() is True
+
 
 # ═════════════════════════════════════════════════════════════════
 #  SUBGRAPH
@@ -314,6 +409,22 @@ class TestSubgraph:
         assert edge.get_attribute("Relation") == "friend"
         assert edge.get_attribute("Weight") == 0.9
 
+    def test_subgraph_by_node_refs_matches_id_variant(self, small_graph):
+        nodes = [small_graph.get_node("A"), small_graph.get_node("B")]
+        sub = small_graph.get_subgraph_by_node_refs(nodes)
+        assert set(sub.nodes) == {"A", "B"}
+        assert set(sub.edges) == {"e1"}
+        assert sub.get_node("A") is not small_graph.get_node("A")
+
+    def test_subgraph_adds_self_loops_and_undirected_edges_once(self, small_graph):
+        a, b = small_graph.get_node("A"), small_graph.get_node("B")
+        small_graph.add_edge(Edge("loop", a, a, EdgeDirection.DIRECTED))
+        small_graph.add_edge(Edge("ba", b, a, EdgeDirection.UNDIRECTED))
+        sub = small_graph.get_subgraph_by_nodes({"A", "B"})
+        assert set(sub.edges) == {"e1", "loop", "ba"}
+        assert len(sub._adjacency_list["A"]) == 3
+        assert len(sub._adjacency_list["B"]) == 2
+
 
 # ═════════════════════════════════════════════════════════════════
 #  SERIALIZATION (to_dict)
@@ -321,28 +432,28 @@ class TestSubgraph:
 
 class TestToDict:
 
-    def test_to_dict_keys(self, small_graph):
-        d = small_graph.to_dict()
+    def test_to_dict_keys(self, small_graph_template):
+        d = small_graph_template.to_dict()
         assert "id" in d
         assert "nodes" in d
         assert "edges" in d
 
-    def test_to_dict_node_count(self, small_graph):
-        d = small_graph.to_dict()
+    def test_to_dict_node_count(self, small_graph_template):
+        d = small_graph_template.to_dict()
         assert len(d["nodes"]) == 4
 
-    def test_to_dict_edge_count(self, small_graph):
-        d = small_graph.to_dict()
+    def test_to_dict_edge_count(self, small_graph_template):
+        d = small_graph_template.to_dict()
         assert len(d["edges"]) == 3
 
-    def test_to_dict_node_structure(self, small_graph):
-        d = small_graph.to_dict()
+    def test_to_dict_node_structure(self, small_graph_template):
+        d = small_graph_template.to_dict()
         node_dict = d["nodes"][0]
         assert "id" in node_dict
         assert "attributes" in node_dict
 
-    def test_to_dict_edge_structure(self, small_graph):
-        d = small_graph.to_dict()
+    def test_to_dict_edge_structure(self, small_graph_template):
+        d = small_graph_template.to_dict()
         edge_dict = d["edges"][0]
         assert "id" in edge_dict
         assert "source" in edge_dict
@@ -350,6 +461,36 @@ class TestToDict:
         assert "direction" in edge_dict
 
 
+# ═════════════════════════════════════════════════════════════════
+#  DEEP COPY
+# ═════════════════════════════════════════════════════════════════
+
+class TestDeepCopy:
+
+    def test_copy_is_independent(self, small_graph):
+        copy = deepcopy(small_graph)
+        assert copy.to_dict() == small_graph.to_dict()
+        copy.get_node("A").set_attribute("Age", 99)
+        copy.remove_edge("e1")
+        assert small_graph.get_node("A").get_attribute("Age") == 30
+        assert small_graph.get_edge("e1") is not None
+
+    def test_edges_reference_copied_nodes(self, small_graph):
+        copy = deepcopy(small_graph)
+        edge = copy.get_edge("e1")
+        assert edge.source_node is copy.get_node("A")
+        assert edge.target_node is copy.get_node("B")
+        assert copy._adjacency_list["B"] == [copy.get_edge("e1"), copy.get_edge("e2")]
+        assert all(e is copy.get_edge(e.edge_id) for e in copy._adjacency_list["B"])
+
+    def test_copy_keeps_node_subclass_and_mutable_values(self, small_graph):
+        small_graph.get_node("A").attributes["Tags"] = ["x"]
+        copy = deepcopy(small_graph)
+        assert type(copy.get_node("A")) is ConcreteNode
+        copy.get_node("A").attributes["Tags"].append("y")
+        assert small_graph.get_node("A").attributes["Tags"] == ["x"]
+
+
 # ═════════════════════════════════════════════════════════════════
 #  MISC
 # ═════════════════════════════════════════════════════════════════
@@ -28,7 +28,7 @@ from graph_platform.config import PlatformConfig
 
 class _PersistNode(Node):
     """Concrete Node for persistence tests."""
-    pass
+    __slots__ = ()
 
 
 # ── Helpers ──────────────────────────────────────────────────────
@@ -190,6 +190,14 @@ class TestRoundTrip:
         ws2 = Workspace.load(file_path)
         assert ws2.history_depth == 2
 
+    def test_loaded_history_keeps_max_history_bound(self, tmp_path):
+        ws1 = Workspace(_build_graph(), max_history=2)
+        ws1.apply_filter("Age >= 25")
+        ws1.apply_filter("Age >= 30")
+        ws2 = Workspace.load(ws1.save(str(tmp_path)))
+        ws2.apply_filter("Age >= 35")
+        assert ws2.history_depth == 2
+
     def test_loaded_workspace_can_undo(self, tmp_path):
         ws1 = Workspace(_build_graph())
         ws1.apply_filter("Age >= 30")
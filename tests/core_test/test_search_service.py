@@ -82,6 +82,13 @@ def test_search_by_value_case_insensitive(stub_graph):
     assert set(result.nodes.keys()) == {"n1", "n3", "n9", "n14"}
 
 
+def test_search_by_value_casefolds_unicode(stub_graph):
+    """Matching uses casefold, so 'STRASSE' matches 'Straße'."""
+    stub_graph.get_node("n1").set_attribute("Street", "Hauptstraße")
+    result = SearchService().search(stub_graph, "Street=STRASSE")
+    assert set(result.nodes.keys()) == {"n1"}
+
+
 def test_search_by_value_int_attribute_as_string(stub_graph):
     """Age is int — '3' matches 30(n1), 35(n3), 33(n7), 31(n9), 38(n12)."""
     result = SearchService().search(stub_graph, "Age=3")
@@ -31,7 +31,7 @@ from services.serialization_service import GraphSerializer
 
 class ConcreteNode(Node):
     """Minimal concrete Node for testing."""
-    pass
+    __slots__ = ()
 
 
 # ── Fixtures ─────────────────────────────────────────────────────
@@ -150,6 +150,12 @@ class TestSerialize:
         assert data["nodes"] == []
         assert data["edges"] == []
 
+    def test_serialize_does_not_mutate_graph(self, serializer, small_graph):
+        before = deepcopy(small_graph.to_dict())
+        data = serializer.serialize(small_graph)
+        data["nodes"][0]["attributes"]["Name"] = "changed"
+        assert small_graph.to_dict() == before
+
 
 # ── SerializationConfig ───────────────────────────────────────────────────────────
 
@@ -462,3 +468,33 @@ class TestTypeRestoration:
         # Should not raise
         restored = serializer.deserialize(data)
         assert restored.get_node("n1") is not None
+
+    def test_shared_type_hints_restore_each_node(self, serializer):
+        """Nodes sharing the same type hints are each converted independently."""
+        data = {
+            "id": "typed",
+            "nodes": [
+                {"id": "n1", "attributes": {"Age": "30", "Active": "true"},
+                 "types": {"Age": "int", "Active": "bool"}},
+                {"id": "n2", "attributes": {"Age": "41", "Active": "no"},
+                 "types": {"Age": "int", "Active": "bool"}},
+            ],
+            "edges": [],
+        }
+        restored = serializer.deserialize(data)
+        assert restored.get_node("n1").get_attribute("Age") == 30
+        assert restored.get_node("n1").get_attribute("Active") is True
+        assert restored.get_node("n2").get_attribute("Age") == 41
+        assert restored.get_node("n2").get_attribute("Active") is False
+
+    def test_unconvertible_value_keeps_raw(self, serializer):
+        """A value that does not match its hint is kept as-is."""
+        data = {
+            "id": "typed",
+            "nodes": [
+                {"id": "n1", "attributes": {"Age": "unknown"}, "types": {"Age": "int"}},
+            ],
+            "edges": [],
+        }
+        restored = serializer.deserialize(data)
+        assert restored.get_node("n1").get_attribute("Age") == "unknown"
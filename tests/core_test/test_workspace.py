@@ -31,7 +31,7 @@ from graph_platform.workspace import Workspace
 
 class _WsNode(Node):
     """Concrete Node for workspace tests."""
-    pass
+    __slots__ = ()
 
 
 # ── Fixtures ─────────────────────────────────────────────────────
@@ -305,6 +305,23 @@ class TestHistoryManagement:
         ws.undo()
         assert ws.history_depth == 1
 
+    def test_snapshot_copies_node_subclass_instance_dict(self):
+        """Node subclasses without __slots__ keep their instance attributes."""
+        class LocalNode(Node):
+            pass
+
+        g = Graph("local")
+        node = LocalNode("x", Age=40)
+        node.tags = ["a"]
+        g.add_node(node)
+        ws = Workspace(g)
+        ws.apply_filter("Age >= 50")
+        restored = ws.undo().get_node("x")
+        assert isinstance(restored, LocalNode)
+        assert restored is not node
+        assert restored.tags == ["a"]
+        assert restored.tags is not node.tags
+
 
 # ── To dictionary ──────────────────────────────────────────────────────────
 
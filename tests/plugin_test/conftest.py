@@ -1,20 +1,32 @@
 import pytest
+from copy import deepcopy
 from pathlib import Path
 from data_source_plugin_rdf.plugin import RDFTurtleDataSourcePlugin
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def plugin():
     return RDFTurtleDataSourcePlugin()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_ttl_path():
     return str(FIXTURES_DIR / "simple_graph1.ttl")
 
 
-@pytest.fixture
-def parsed_graph(plugin, sample_ttl_path):
+@pytest.fixture(scope="session")
+def sample_xml_path():
+    return str(FIXTURES_DIR / "xml_graph1.xml")
+
+
+@pytest.fixture(scope="session")
+def parsed_graph_template(plugin, sample_ttl_path):
+    """Turtle fixture parsed once per session; never mutate it — use ``parsed_graph``."""
     return plugin.parse(file_path=sample_ttl_path)
+
+
+@pytest.fixture
+def parsed_graph(parsed_graph_template):
+    return deepcopy(parsed_graph_template)
@@ -1,5 +1,6 @@
 import json
 import pytest
+from copy import deepcopy
 from datetime import date, datetime
 from pathlib import Path
 
@@ -14,18 +15,26 @@ GRAPH_PATH       = FIXTURES_DIR / "json_graph1.json"
 CYCLIC_PATH      = FIXTURES_DIR / "json_cyclic1.json"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def plugin():
     return JsonDataSourcePlugin()
 
-@pytest.fixture
-def graph(plugin):
+@pytest.fixture(scope="module")
+def graph_template(plugin):
     return plugin.parse(file_path=str(GRAPH_PATH))
 
-@pytest.fixture
-def cyclic_graph(plugin):
+@pytest.fixture(scope="module")
+def cyclic_graph_template(plugin):
     return plugin.parse(file_path=str(CYCLIC_PATH))
 
+@pytest.fixture
+def graph(graph_template):
+    return deepcopy(graph_template)
+
+@pytest.fixture
+def cyclic_graph(cyclic_graph_template):
+    return deepcopy(cyclic_graph_template)
+
 
 # ── Plugin metadata ───────────────────────────────────────────────────────────
 
@@ -205,6 +214,13 @@ class TestArbitraryJSON:
         g = plugin.parse(file_path=str(p))
         assert g.get_number_of_nodes() == 0
 
+    def test_values_outside_strict_json(self, plugin, tmp_path):
+        """NaN and integers beyond 64 bits load as with the stdlib parser."""
+        p = tmp_path / "loose.json"
+        p.write_text('{"@id": "n1", "big": 123456789012345678901234567890, "ratio": NaN}')
+        g = plugin.parse(file_path=str(p))
+        assert g.get_node("n1").get_attribute("big") == 123456789012345678901234567890
+
 
 # ── Error handling ────────────────────────────────────────────────────────────
 
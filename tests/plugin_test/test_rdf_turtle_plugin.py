@@ -3,7 +3,7 @@ from pathlib import Path
 
 from api.models.edge import EdgeDirection
 from api.models.graph import Graph
-from data_source_plugin_rdf.plugin import RDFTurtleDataSourcePlugin, RDFNode
+from data_source_plugin_rdf.plugin import RDFTurtleDataSourcePlugin, RDFNode, _local_name
 from api.plugins.base import DataSourcePlugin
 
 
@@ -14,6 +14,16 @@ BOB_URI   = "http://example.org/graph#Bob"
 CAROL_URI = "http://example.org/graph#Carol"
 DAVE_URI  = "http://example.org/graph#Dave"
 CORP_URI  = "http://example.org/graph#TechCorp"
+EXPECTED_URIS = frozenset((ALICE_URI, BOB_URI, CAROL_URI, DAVE_URI, CORP_URI))
+
+
+@pytest.fixture(scope="module")
+def edge_index(parsed_graph_template):
+    """(source URI, target URI, label) -> edge, built once from the shared parse."""
+    return {
+        (edge.source_node.node_id, edge.target_node.node_id, edge.get_attribute("label")): edge
+        for edge in parsed_graph_template.get_all_edges()
+    }
 
 
 # ── Plugin metadata ───────────────────────────────────────────────────────────
@@ -51,9 +61,8 @@ class TestGraphStructure:
 class TestNodeParsing:
 
     def test_all_expected_nodes_present(self, parsed_graph):
-        expected_uris = {ALICE_URI, BOB_URI, CAROL_URI, DAVE_URI, CORP_URI}
         actual_ids = {node.node_id for node in parsed_graph.get_all_nodes()}
-        assert expected_uris == actual_ids
+        assert EXPECTED_URIS == actual_ids
 
     def test_nodes_are_rdf_node_instances(self, parsed_graph):
         for node in parsed_graph.get_all_nodes():
@@ -72,6 +81,15 @@ class TestNodeParsing:
         corp = parsed_graph.get_node(CORP_URI)
         assert corp.get_attribute("name") == "TechCorp"
 
+    @pytest.mark.parametrize("uri, expected", [
+        ("http://example.org/graph#Alice", "Alice"),
+        ("http://example.org/a#b#c", "c"),
+        ("http://example.org/people/Bob", "Bob"),
+        ("http://example.org/people/Bob/", "Bob"),
+    ])
+    def test_local_name(self, uri, expected):
+        assert _local_name(uri) == expected
+
     def test_rdf_type_not_stored_as_attribute_key_type(self, parsed_graph):
         # rdf:type triples should not create edges, but 'type' may appear
         # as literal if explicitly set — here it's not, so it must be absent
@@ -83,40 +101,16 @@ class TestNodeParsing:
 
 class TestEdgeParsing:
 
-    def _find_edge(self, graph, source_uri, target_uri, label):
-        """Helper: find an edge by source, target, and label attribute."""
-        for edge in graph.get_all_edges():
-            if (
-                edge.source_node.node_id == source_uri
-                and edge.target_node.node_id == target_uri
-                and edge.get_attribute("label") == label
-            ):
-                return edge
-        return None
-
-    def test_knows_edge_alice_to_bob(self, parsed_graph):
-        edge = self._find_edge(parsed_graph, ALICE_URI, BOB_URI, "knows")
-        assert edge is not None
-
-    def test_knows_edge_alice_to_dave(self, parsed_graph):
-        edge = self._find_edge(parsed_graph, ALICE_URI, DAVE_URI, "knows")
-        assert edge is not None
-
-    def test_manages_edge_carol_to_alice(self, parsed_graph):
-        edge = self._find_edge(parsed_graph, CAROL_URI, ALICE_URI, "manages")
-        assert edge is not None
-
-    def test_manages_edge_carol_to_bob(self, parsed_graph):
-        edge = self._find_edge(parsed_graph, CAROL_URI, BOB_URI, "manages")
-        assert edge is not None
-
-    def test_works_for_alice_to_techcorp(self, parsed_graph):
-        edge = self._find_edge(parsed_graph, ALICE_URI, CORP_URI, "works_for")
-        assert edge is not None
-
-    def test_works_for_bob_to_techcorp(self, parsed_graph):
-        edge = self._find_edge(parsed_graph, BOB_URI, CORP_URI, "works_for")
-        assert edge is not None
+    @pytest.mark.parametrize("source, target, label", [
+        (ALICE_URI, BOB_URI, "knows"),
+        (ALICE_URI, DAVE_URI, "knows"),
+        (CAROL_URI, ALICE_URI, "manages"),
+        (CAROL_URI, BOB_URI, "manages"),
+        (ALICE_URI, CORP_URI, "works_for"),
+        (BOB_URI, CORP_URI, "works_for"),
+    ])
+    def test_expected_edge_present(self, edge_index, source, target, label):
+        assert (source, target, label) in edge_index
 
     def test_all_edges_are_directed(self, parsed_graph):
         for edge in parsed_graph.get_all_edges():
@@ -164,3 +158,13 @@ class TestErrorHandling:
         graph = plugin.parse(file_path=str(ttl))
         assert graph.get_number_of_edges() == 0
         assert graph.get_number_of_nodes() == 1
+
+    def test_blank_node_subject_keeps_uri_object_without_edge(self, plugin, tmp_path):
+        ttl = tmp_path / "blank_subject.ttl"
+        ttl.write_text(
+            '@prefix ex: <http://example.org/> .\n'
+            '_:b1 ex:knows ex:Node2 ; ex:name "Anon" .\n'
+        )
+        graph = plugin.parse(file_path=str(ttl))
+        assert set(graph.nodes) == {"http://example.org/Node2"}
+        assert graph.get_number_of_edges() == 0
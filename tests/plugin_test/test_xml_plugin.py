@@ -1,27 +1,41 @@
+import sys
 import pytest
+from copy import deepcopy
 from pathlib import Path
 from lxml import etree
 
-from api.models.graph import Graph, Node
-from api.models.edge import EdgeDirection, Edge
+from api.models.graph import Graph
+from api.models.edge import EdgeDirection
 from api.plugins.base import DataSourcePlugin
 
 from data_source_plugin_xml.plugin import XmlDataSourcePlugin, XMLNode
 
 FIXTURES_DIR = Path(__file__).parent / "fixtures"
-SAMPLE_XML_PATH = FIXTURES_DIR / "xml_graph1.xml"
+EXPECTED_ELEMENT_NODES = frozenset(("Person[1]", "Person[2]", "Person[3]", "Person[4]", "Organization[1]"))
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def plugin():
     return XmlDataSourcePlugin()
 
-@pytest.fixture
-def sample_xml_path():
-    return SAMPLE_XML_PATH
+@pytest.fixture(scope="module", params=["dom", "iterparse"])
+def parsed_graph_template(request, sample_xml_path):
+    """
+    XML fixture parsed once per module and parser mode; never mutate it —
+    use ``parsed_graph``. Every parsed-graph test runs against both parsers.
+    """
+    return XmlDataSourcePlugin(mode=request.param).parse(file_path=sample_xml_path)
 
 @pytest.fixture
-def parsed_graph(plugin, sample_xml_path):
-    return plugin.parse(file_path=str(sample_xml_path))
+def parsed_graph(parsed_graph_template):
+    return deepcopy(parsed_graph_template)
+
+@pytest.fixture(scope="module")
+def edge_index(parsed_graph_template):
+    """(source id, target id, relation) -> edge, so lookups skip the edge scan."""
+    return {
+        (edge.source_node.node_id, edge.target_node.node_id, edge.attributes['label']): edge
+        for edge in parsed_graph_template.get_all_edges()
+    }
 
 
 # ── Plugin metadata ───────────────────────────────────────────────────────────
@@ -40,7 +54,7 @@ class TestGraphStructure:
         assert isinstance(parsed_graph, Graph)
 
     def test_graph_id_is_file_path(self, parsed_graph, sample_xml_path):
-        assert parsed_graph.graph_id == str(sample_xml_path)
+        assert parsed_graph.graph_id == sample_xml_path
 
     def test_correct_node_count(self, parsed_graph):
         # Per SPECS §2.2: "Tagove koji nemaju decu, posmatrati samo kao atribute"
@@ -58,16 +72,15 @@ class TestGraphStructure:
         assert parsed_graph.get_number_of_edges() == 11
 
     def test_graph_id_is_file_path(self, parsed_graph, sample_xml_path):
-        assert parsed_graph.graph_id == str(sample_xml_path)
+        assert parsed_graph.graph_id == sample_xml_path
 
 
 class TestNodeParsing:
     def test_element_nodes_present(self, parsed_graph: Graph):
-        expected = {"Person[1]", "Person[2]", "Person[3]", "Person[4]", "Organization[1]"}
         actual = {n.node_id for n in parsed_graph.get_all_nodes()}
 
         # subset because of attr nodes
-        assert expected.issubset(actual)
+        assert EXPECTED_ELEMENT_NODES.issubset(actual)
 
     def test_attribute_nodes_exist_and_have_values(self, parsed_graph: Graph):
         # Per SPECS §2.2: leaf elements without XML attributes become node attributes
@@ -93,28 +106,22 @@ class TestNodeParsing:
 
 
 class TestEdgeParsing:
-    def _find_edge(self, graph: Graph, src_id: Node, tgt_id: Node, relation: str) -> Edge:
-        for edge in graph.get_all_edges():
-            if edge.source_node.node_id == src_id and edge.target_node.node_id == tgt_id and edge.attributes['label'] == relation:
-                return edge
-        return None
-
-    def test_knows_edge_alice_to_bob(self, parsed_graph):
-        edge = self._find_edge(parsed_graph, "Person[1]", "Person[2]", "knows")
+    def test_knows_edge_alice_to_bob(self, edge_index):
+        edge = edge_index.get(("Person[1]", "Person[2]", "knows"))
         assert edge is not None
 
-    def test_works_for_alice_to_techcorp(self, parsed_graph):
-        edge = self._find_edge(parsed_graph, "Person[1]", "Organization[1]", "works_for")
+    def test_works_for_alice_to_techcorp(self, edge_index):
+        edge = edge_index.get(("Person[1]", "Organization[1]", "works_for"))
         assert edge is not None
 
-    def test_manages_edges_carol(self, parsed_graph):
-        e1 = self._find_edge(parsed_graph, "Person[3]", "Person[1]", "manages")
-        e2 = self._find_edge(parsed_graph, "Person[3]", "Person[2]", "manages")
+    def test_manages_edges_carol(self, edge_index):
+        e1 = edge_index.get(("Person[3]", "Person[1]", "manages"))
+        e2 = edge_index.get(("Person[3]", "Person[2]", "manages"))
         assert e1 is not None and e2 is not None
 
-    def test_attribute_edges_exist(self, parsed_graph):
+    def test_attribute_edges_exist(self, edge_index):
         # Only Person[2]:name is a separate node (due to lang attribute)
-        edge = self._find_edge(parsed_graph, "Person[2]", "Person[2]:name", "name")
+        edge = edge_index.get(("Person[2]", "Person[2]:name", "name"))
         assert edge is not None
 
     def test_attr_edge_includes_element_attributes(self, parsed_graph: Graph):
@@ -125,6 +132,16 @@ class TestEdgeParsing:
         assert node.attributes.get('value') == 'Bob'
 
 
+class TestParseDepth:
+    @pytest.mark.parametrize("mode", ["dom", "iterparse"])
+    def test_nesting_beyond_recursion_limit_builds_child_chain(self, mode, tmp_path):
+        depth = sys.getrecursionlimit() + 500
+        deep = tmp_path / "deep.xml"
+        deep.write_text("<n><v>1</v>" * depth + "</n>" * depth)
+        graph = XmlDataSourcePlugin(mode=mode).parse(file_path=str(deep))
+        assert graph.get_number_of_nodes() == depth
+        assert graph.get_edge(f"child:n[{depth - 1}]->n[{depth}]") is not None
+
 
 class TestErrorHandling:
     def test_missing_file_path_parameter_raises_value_error(self, plugin):
@@ -139,4 +156,84 @@ class TestErrorHandling:
         empty = tmp_path / "empty.xml"
         empty.write_text("")  # an empty file is not well-formed XML
         with pytest.raises(etree.XMLSyntaxError):
-            plugin.parse(file_path=str(empty))
\ No newline at end of file
+            plugin.parse(file_path=str(empty))
+
+# ── Streaming parser ──────────────────────────────────────────────────────────
+
+def _graph_snapshot(graph):
+    nodes = [(n.node_id, n.attributes) for n in graph.get_all_nodes()]
+    edges = [(e.edge_id, e.source_node.node_id, e.target_node.node_id, e.attributes)
+             for e in graph.get_all_edges()]
+    return nodes, edges
+
+
+class TestStreamingParse:
+
+    @pytest.mark.parametrize("fixture", ["xml_graph1.xml", "test_xml.xml"])
+    def test_streaming_matches_dom(self, plugin, fixture):
+        path = str(FIXTURES_DIR / fixture)
+        streamed = plugin._parse_streaming(path, "reference")
+        loaded = plugin._parse_dom(path, "reference")
+        assert _graph_snapshot(streamed) == _graph_snapshot(loaded)
+
+    def test_large_files_use_streaming(self, plugin, sample_xml_path, monkeypatch):
+        import data_source_plugin_xml.plugin as xml_plugin
+        monkeypatch.setattr(xml_plugin, "_STREAMING_THRESHOLD_BYTES", 0)
+        monkeypatch.setattr(plugin, "_parse_dom", None)  # must not be reached
+        graph = plugin.parse(file_path=sample_xml_path)
+        assert graph.get_number_of_nodes() == 7
+
+    def test_unknown_mode_raises(self):
+        with pytest.raises(ValueError, match="mode"):
+            XmlDataSourcePlugin(mode="sax")
+
+    def test_iterparse_mode_streams_small_files(self, sample_xml_path, monkeypatch):
+        plugin = XmlDataSourcePlugin(mode="iterparse")
+        monkeypatch.setattr(plugin, "_parse_dom", None)  # must not be reached
+        graph = plugin.parse(file_path=sample_xml_path)
+        assert graph.get_number_of_nodes() == 7
+
+    def test_dom_mode_skips_streaming_for_large_files(self, sample_xml_path, monkeypatch):
+        import data_source_plugin_xml.plugin as xml_plugin
+        monkeypatch.setattr(xml_plugin, "_STREAMING_THRESHOLD_BYTES", 0)
+        plugin = XmlDataSourcePlugin(mode="dom")
+        monkeypatch.setattr(plugin, "_parse_streaming", None)  # must not be reached
+        graph = plugin.parse(file_path=sample_xml_path)
+        assert graph.get_number_of_nodes() == 7
+
+    def test_unsupported_reference_falls_back_to_dom(self, plugin, tmp_path, monkeypatch):
+        import data_source_plugin_xml.plugin as xml_plugin
+        monkeypatch.setattr(xml_plugin, "_STREAMING_THRESHOLD_BYTES", 0)
+        xml = tmp_path / "descendant_ref.xml"
+        xml.write_text(
+            "<root><p><n>1</n></p>"
+            "<q><m>1</m><link><p reference=\"//p[n='1']\"/></link></q></root>"
+        )
+        graph = plugin.parse(file_path=str(xml))
+        edge = graph.get_edge("child:q[1]->p[1]")
+        assert edge is not None
+        assert edge.get_attribute("label") == "link"
+
+    def test_prolog_processing_instruction_streams(self, plugin, tmp_path):
+        xml = tmp_path / "stylesheet.xml"
+        xml.write_text(
+            '<?xml version="1.0"?>\n'
+            '<?xml-stylesheet type="text/xsl" href="s.xsl"?>\n'
+            "<A><B>1</B><C><D>2</D></C></A>"
+        )
+        streamed = XmlDataSourcePlugin(mode="iterparse").parse(file_path=str(xml))
+        loaded = plugin._parse_dom(str(xml), "reference")
+        assert _graph_snapshot(streamed) == _graph_snapshot(loaded)
+
+    def test_internal_dtd_entity_is_not_streamed(self, plugin, tmp_path):
+        import data_source_plugin_xml.plugin as xml_plugin
+        xml = tmp_path / "entity.xml"
+        xml.write_text(
+            '<?xml version="1.0"?>\n'
+            '<!DOCTYPE A [<!ENTITY e "v">]>\n'
+            "<A><B>x&e;y</B></A>"
+        )
+        with pytest.raises(xml_plugin._StreamingUnsupported):
+            plugin._parse_streaming(str(xml), "reference")
+        graph = XmlDataSourcePlugin(mode="iterparse").parse(file_path=str(xml))
+        assert graph.get_node("A[1]").get_attribute("B") == "xy"